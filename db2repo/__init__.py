@@ -6,10 +6,37 @@ in a git repository. Supports multiple database platforms with an extensible
 adapter pattern, starting with Snowflake.
 """
 
+import sys
+from typing import Any
+
 __version__ = "0.1.0"
 __author__ = "Your Name"
 __email__ = "your.email@company.com"
 
-from .cli import cli
+__all__ = ["cli", "main"]
+
+
+def __getattr__(name: str) -> Any:
+    # The CLI (and click with it) is imported on first access, so the
+    # version fast path in main() does not pay for it.
+    if name == "cli":
+        from .cli import cli
+
+        return cli
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def main() -> None:
+    """Console script entry point."""
+    if sys.argv[1:] == ["--version"]:
+        print(f"db2repo, version {__version__}")
+        return
+    if sys.argv[1:] == ["version"]:
+        # Printed unstyled: styling it like the click command would mean
+        # importing click, which this fast path exists to avoid
+        print(f"DB2Repo version {__version__}")
+        return
+
+    from .cli import cli
 
-__all__ = ["cli"]
+    cli()
@@ -0,0 +1,5 @@
+"""Allow running DB2Repo with ``python -m db2repo``."""
+
+from . import main
+
+main()
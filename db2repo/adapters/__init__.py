@@ -5,34 +5,65 @@ This package contains database-specific adapters that implement
 the common interface for DDL extraction.
 """
 
-from .base import DatabaseAdapter
-from .snowflake import SnowflakeAdapter
-from typing import Dict, Type, Any
+import importlib
+import sys
+from types import MappingProxyType
+
+from .base import DatabaseAdapter, DDLRecord
+from typing import Dict, Mapping, Type, Any, Union
+
+AdapterRef = Union[str, Type[DatabaseAdapter]]
 
 
 class AdapterFactory:
     """Factory for creating database adapters based on platform name."""
 
-    _registry: Dict[str, Type[DatabaseAdapter]] = {}
+    # Platform names are interned so lookups with interned keys compare by
+    # identity. Only register_adapter writes; everything else reads the view.
+    _adapters: Dict[str, AdapterRef] = {}
+    _registry: Mapping[str, AdapterRef] = MappingProxyType(_adapters)
 
     @classmethod
-    def register_adapter(
-        cls, platform: str, adapter_cls: Type[DatabaseAdapter]
-    ) -> None:
-        cls._registry[platform.lower()] = adapter_cls
+    def register_adapter(cls, platform: str, adapter_cls: AdapterRef) -> None:
+        """
+        Register an adapter class for a platform.
+
+        Args:
+            platform: Platform name (case-insensitive)
+            adapter_cls: Adapter class, or a "module:ClassName" import path that
+                is only imported the first time the platform is requested
+        """
+        cls._adapters[sys.intern(platform.lower())] = adapter_cls
 
     @classmethod
     def get_adapter(cls, config: Dict[str, Any]) -> DatabaseAdapter:
-        platform = config.get("platform", "").lower()
+        platform = sys.intern(config.get("platform", "").lower())
         if not platform:
             raise ValueError("No platform specified in config.")
         adapter_cls = cls._registry.get(platform)
         if not adapter_cls:
             raise ValueError(f"No adapter registered for platform '{platform}'")
+        if isinstance(adapter_cls, str):
+            module_name, _, class_name = adapter_cls.partition(":")
+            adapter_cls = getattr(importlib.import_module(module_name), class_name)
+            cls._adapters[platform] = adapter_cls
         return adapter_cls(config)
 
 
-# Register built-in adapters
-AdapterFactory.register_adapter("snowflake", SnowflakeAdapter)
+# Register built-in adapters. They are referenced by import path so database
+# drivers are only imported when a profile for that platform is used.
+AdapterFactory.register_adapter(
+    "snowflake", "db2repo.adapters.snowflake:SnowflakeAdapter"
+)
+
+__all__ = ["DatabaseAdapter", "DDLRecord", "AdapterFactory", "SnowflakeAdapter"]
+
+
+def __getattr__(name: str) -> Any:
+    # Keep ``from db2repo.adapters import SnowflakeAdapter`` working without
+    # importing the Snowflake driver when the package is imported.
+    if name == "SnowflakeAdapter":
+        from .snowflake import SnowflakeAdapter
 
-__all__ = ["DatabaseAdapter", "AdapterFactory"]
+        return SnowflakeAdapter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
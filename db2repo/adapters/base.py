@@ -6,7 +6,19 @@ must implement for DDL extraction.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
+
+
+class DDLRecord(NamedTuple):
+    """DDL extracted for a single database object."""
+
+    name: str
+    type: str
+    database: str
+    schema: str
+    ddl: Optional[str]
+    error: Optional[str] = None
+    language: Optional[str] = None
 
 
 class DatabaseAdapter(ABC):
@@ -38,7 +50,7 @@ class DatabaseAdapter(ABC):
         pass
 
     @abstractmethod
-    def get_tables(self, database: str, schema: str) -> List[Dict[str, Any]]:
+    def get_tables(self, database: str, schema: str) -> List[DDLRecord]:
         """
         Get DDL for all tables in the specified database and schema.
 
@@ -47,12 +59,12 @@ class DatabaseAdapter(ABC):
             schema: Schema name
 
         Returns:
-            List of dictionaries containing table information and DDL
+            List of DDL records for each table
         """
         pass
 
     @abstractmethod
-    def get_views(self, database: str, schema: str) -> List[Dict[str, Any]]:
+    def get_views(self, database: str, schema: str) -> List[DDLRecord]:
         """
         Get DDL for all views in the specified database and schema.
 
@@ -61,14 +73,14 @@ class DatabaseAdapter(ABC):
             schema: Schema name
 
         Returns:
-            List of dictionaries containing view information and DDL
+            List of DDL records for each view
         """
         pass
 
     @abstractmethod
     def get_materialized_views(
         self, database: str, schema: str
-    ) -> List[Dict[str, Any]]:
+    ) -> List[DDLRecord]:
         """
         Get DDL for all materialized views in the specified database and schema.
 
@@ -77,12 +89,12 @@ class DatabaseAdapter(ABC):
             schema: Schema name
 
         Returns:
-            List of dictionaries containing materialized view information and DDL
+            List of DDL records for each materialized view
         """
         pass
 
     @abstractmethod
-    def get_stages(self, database: str, schema: str) -> List[Dict[str, Any]]:
+    def get_stages(self, database: str, schema: str) -> List[DDLRecord]:
         """
         Get DDL for all stages in the specified database and schema.
 
@@ -91,12 +103,12 @@ class DatabaseAdapter(ABC):
             schema: Schema name
 
         Returns:
-            List of dictionaries containing stage information and DDL
+            List of DDL records for each stage
         """
         pass
 
     @abstractmethod
-    def get_snowpipes(self, database: str, schema: str) -> List[Dict[str, Any]]:
+    def get_snowpipes(self, database: str, schema: str) -> List[DDLRecord]:
         """
         Get DDL for all snow pipes in the specified database and schema.
 
@@ -105,12 +117,12 @@ class DatabaseAdapter(ABC):
             schema: Schema name
 
         Returns:
-            List of dictionaries containing snow pipe information and DDL
+            List of DDL records for each snow pipe
         """
         pass
 
     @abstractmethod
-    def get_stored_procedures(self, database: str, schema: str) -> List[Dict[str, Any]]:
+    def get_stored_procedures(self, database: str, schema: str) -> List[DDLRecord]:
         """
         Get DDL for all stored procedures in the specified database and schema.
 
@@ -119,10 +131,51 @@ class DatabaseAdapter(ABC):
             schema: Schema name
 
         Returns:
-            List of dictionaries containing stored procedure information and DDL
+            List of DDL records for each stored procedure
         """
         pass
 
+    def get_all_objects(
+        self, database: str, schema: str
+    ) -> Dict[str, List[DDLRecord]]:
+        """
+        Get DDL for every supported object type in the specified database and schema.
+
+        Adapters that can fetch several object types in one round-trip should
+        override this; the default calls each get_* method in turn.
+
+        Args:
+            database: Database name
+            schema: Schema name
+
+        Returns:
+            Mapping of object type (TABLE, VIEW, ...) to its DDL records
+        """
+        return {
+            "TABLE": self.get_tables(database, schema),
+            "VIEW": self.get_views(database, schema),
+            "MATERIALIZED_VIEW": self.get_materialized_views(database, schema),
+            "STAGE": self.get_stages(database, schema),
+            "PIPE": self.get_snowpipes(database, schema),
+            "PROCEDURE": self.get_stored_procedures(database, schema),
+        }
+
+    def get_schema_fingerprint(self, database: str, schema: str) -> Optional[str]:
+        """
+        Get a cheap marker that changes whenever an object in the schema does.
+
+        Adapters that can read object modification times from their catalog
+        should override this; the default returns None, meaning unknown.
+
+        Args:
+            database: Database name
+            schema: Schema name
+
+        Returns:
+            Opaque fingerprint string, or None if it cannot be determined
+        """
+        return None
+
     @abstractmethod
     def test_connection(self) -> bool:
         """
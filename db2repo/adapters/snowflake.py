@@ -4,29 +4,360 @@ Snowflake database adapter for DB2Repo.
 This module implements the DatabaseAdapter interface for Snowflake databases.
 """
 
-# Set CFFI environment variables before any imports to work around memory allocation issues
+import atexit
+import functools
+import hashlib
 import os
-os.environ['CFFI_ALLOW_SOURCE_CODE'] = '1'
-os.environ['CFFI_USE_PYTHON_API'] = '1'
-os.environ['CFFI_BUILDING'] = '1'
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
-from typing import Any, Dict, List
-
-from .base import DatabaseAdapter
+from .base import DatabaseAdapter, DDLRecord
 from db2repo.exceptions import DatabaseConnectionError
+from db2repo.utils.ddl_cache import DDLCache
+
+# Set CFFI environment variables once, before the connector is imported, to
+# work around memory allocation issues. Values already set by the user are kept.
+os.environ.setdefault('CFFI_ALLOW_SOURCE_CODE', '1')
+os.environ.setdefault('CFFI_USE_PYTHON_API', '1')
+os.environ.setdefault('CFFI_BUILDING', '1')
 
 try:
     import snowflake.connector
+
+    _HAS_SNOWFLAKE = True
 except ImportError:
     snowflake = None
+    _HAS_SNOWFLAKE = False
+
+# Catalog view, column prefix, GET_DDL object type and extra filter for each
+# object type whose DDL can be fetched in one round-trip.
+_CATALOG_SOURCES = {
+    "TABLE": ("TABLES", "TABLE", "TABLE", "AND TABLE_TYPE = 'BASE TABLE'"),
+    "VIEW": ("VIEWS", "TABLE", "VIEW", ""),
+    "MATERIALIZED_VIEW": (
+        "TABLES",
+        "TABLE",
+        "VIEW",
+        "AND TABLE_TYPE = 'MATERIALIZED VIEW'",
+    ),
+    "PIPE": ("PIPES", "PIPE", "PIPE", ""),
+}
+
+# Quoted "catalog"."schema"."name" expression for each catalog view, so GET_DDL
+# resolves mixed-case identifiers exactly as they are stored.
+_FQN_EXPR = {
+    object_type: (
+        f"'\"' || {prefix}_CATALOG || '\".\"' || {prefix}_SCHEMA || '\".\"' "
+        f"|| {prefix}_NAME || '\"'"
+    )
+    for object_type, (_, prefix, _, _) in _CATALOG_SOURCES.items()
+}
+
+# Catalog column holding an object's full DDL, where one exists. Views carry it
+# in INFORMATION_SCHEMA.VIEWS.VIEW_DEFINITION, which is NULL for secure views
+# the role does not own; GET_DDL is only run for those.
+_DEFINITION_EXPR = {object_type: "NULL" for object_type in _CATALOG_SOURCES}
+_DEFINITION_EXPR["VIEW"] = "VIEW_DEFINITION"
+
+# Lists objects as (name, quoted FQN, LAST_ALTERED, definition) rows. GET_DDL
+# is never evaluated here: see _DDL_BATCH_SELECT.
+_LIST_OBJECTS_SQL = {
+    object_type: (
+        f"SELECT {prefix}_NAME, {_FQN_EXPR[object_type]}, LAST_ALTERED, "
+        f"{_DEFINITION_EXPR[object_type]} "
+        f"FROM identifier(%s) WHERE {prefix}_SCHEMA = %s {extra}"
+    ).rstrip()
+    for object_type, (_, prefix, _, extra) in _CATALOG_SOURCES.items()
+}
+# _LIST_OBJECTS_SQL for every GET_DDL-backed object type in one statement, as
+# (object type, name, quoted FQN, LAST_ALTERED, definition) rows.
+_LIST_ALL_OBJECTS_SQL = " UNION ALL ".join(
+    (
+        f"SELECT '{object_type}', {prefix}_NAME, {_FQN_EXPR[object_type]}, "
+        f"LAST_ALTERED, {_DEFINITION_EXPR[object_type]} "
+        f"FROM identifier(%s) WHERE {prefix}_SCHEMA = %s {extra}"
+    ).rstrip()
+    for object_type, (_, prefix, _, extra) in _CATALOG_SOURCES.items()
+)
+
+# Snowflake only accepts constant arguments to GET_DDL, so it cannot be
+# evaluated per row of a catalog query. Objects are listed first, then their
+# DDL is fetched with up to _DDL_BATCH_SIZE of these selects joined by UNION
+# ALL, as (object type, name, ddl) rows. The connector interpolates %s binds
+# client-side, so every GET_DDL call reaches the server with literal arguments.
+_DDL_BATCH_SELECT = "SELECT %s, %s, GET_DDL(%s, %s)"
+_DDL_BATCH_SIZE = 100
+_SINGLE_DDL_SQL = "SELECT GET_DDL(%s, %s)"
+
+# Procedure DDL is rebuilt from its catalog row rather than with GET_DDL,
+# which would need one constant-argument query per overload.
+_PROCEDURES_SQL = (
+    "SELECT PROCEDURE_NAME, ARGUMENT_SIGNATURE, PROCEDURE_LANGUAGE, "
+    "PROCEDURE_DEFINITION, DATA_TYPE FROM identifier(%s) "
+    "WHERE PROCEDURE_SCHEMA = %s AND PROCEDURE_NAME ILIKE %s"
+)
+# INFORMATION_SCHEMA.STAGES has no storage integration column, so stages are
+# listed with SHOW STAGES; its columns are looked up by name.
+_SHOW_STAGES_SQL = "SHOW STAGES IN SCHEMA {database}.{schema}"
+
+# Object count and newest LAST_ALTERED across every catalog view sync reads
+# (TABLES also lists views and materialized views). The count catches drops,
+# which do not advance LAST_ALTERED on the remaining objects.
+_FINGERPRINT_VIEWS = {
+    "TABLES": "TABLE",
+    "PIPES": "PIPE",
+    "PROCEDURES": "PROCEDURE",
+    "STAGES": "STAGE",
+}
+_FINGERPRINT_SQL = (
+    "SELECT COUNT(*), MAX(LAST_ALTERED) FROM ("
+    + " UNION ALL ".join(
+        f"SELECT LAST_ALTERED FROM identifier(%s) WHERE {prefix}_SCHEMA = %s"
+        for prefix in _FINGERPRINT_VIEWS.values()
+    )
+    + ")"
+)
+
+
+def _sql_literal(value: str) -> str:
+    """Quote a value as a Snowflake string literal."""
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def _stage_ddl(schema: str, stage: Dict[str, Any]) -> str:
+    """Build CREATE STAGE DDL from a SHOW STAGES row, keyed by column name."""
+    lines = [f"CREATE OR REPLACE STAGE {schema}.{stage['name']}"]
+    if stage.get("url"):
+        lines.append(f"  URL = {_sql_literal(stage['url'])}")
+    if stage.get("storage_integration"):
+        lines.append(f"  STORAGE_INTEGRATION = {stage['storage_integration']}")
+    # Internal stages with server-side encryption only are listed with this type
+    if (stage.get("type") or "").upper() == "INTERNAL NO CSE":
+        lines.append("  ENCRYPTION = (TYPE = 'SNOWFLAKE_SSE')")
+    if stage.get("comment"):
+        lines.append(f"  COMMENT = {_sql_literal(stage['comment'])}")
+    return "\n".join(lines) + ";"
+
+
+def _procedure_ddl(
+    schema: str, name: str, args: str, language: str, body: str, returns: str
+) -> str:
+    """Build CREATE PROCEDURE DDL from an INFORMATION_SCHEMA.PROCEDURES row."""
+    header = (
+        f"CREATE OR REPLACE PROCEDURE {schema}.{name} {args}\n"
+        f"RETURNS {returns}\nLANGUAGE {language}\nAS"
+    )
+    # SQL bodies are emitted as is; other languages are quoted with $$
+    if language.upper() == "SQL":
+        return f"{header}\n{body.strip()}"
+    return f"{header}\n$$\n{body.strip()}\n$$"
+
+
+def _fetch_rows_columnar(cursor: Any) -> List[Tuple[Any, ...]]:
+    """
+    Fetch all rows of a result set via Arrow record batches.
+
+    Columns are converted to Python lists in bulk instead of the connector
+    building one tuple per row. Falls back to fetchall() when pyarrow is not
+    installed or the result is not in Arrow format.
+    """
+    try:
+        batches = cursor.fetch_arrow_batches()
+    except Exception:
+        return list(cursor.fetchall())
+    rows: List[Tuple[Any, ...]] = []
+    for batch in batches:
+        rows.extend(zip(*(column.to_pylist() for column in batch.columns)))
+    return rows
+
+
+def _stale_objects(
+    objects: Sequence[Tuple[Any, ...]], cached: Dict[str, Tuple[str, str]]
+) -> List[Tuple[Any, ...]]:
+    """Select _list_objects rows whose LAST_ALTERED differs from the cache."""
+    return [obj for obj in objects if cached.get(obj[0], (None,))[0] != str(obj[2])]
+
+
+@functools.lru_cache(maxsize=8)
+def _load_private_key(
+    path: str, mtime: float, passphrase: Optional[str] = None
+) -> bytes:
+    """
+    Read a private key file and return it as unencrypted PKCS#8 DER bytes.
+
+    ``mtime`` is only part of the cache key: an edited key file is re-read,
+    an unchanged one is parsed once per process.
+    """
+    from cryptography.hazmat.primitives import serialization
+
+    with open(path, "rb") as key_file:
+        data = key_file.read()
+    password = passphrase.encode() if passphrase else None
+    if data.lstrip().startswith(b"-----BEGIN"):
+        key = serialization.load_pem_private_key(data, password=password)
+    else:
+        key = serialization.load_der_private_key(data, password=password)
+    return key.private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+
+
+# Rows pulled per fetchmany() call when streaming DDL result sets.
+_FETCH_BATCH_SIZE = 1000
+
+
+def _iter_rows(cursor: Any, size: int = _FETCH_BATCH_SIZE) -> Iterator[Any]:
+    """
+    Stream a result set in fetchmany() batches.
+
+    Rows are turned into records while later batches are still arriving, and
+    peak memory is bounded by the batch size rather than the full result set.
+    """
+    while True:
+        batch = cursor.fetchmany(size)
+        if not batch:
+            return
+        yield from batch
+
+
+# Default upper bound on concurrent per-object metadata queries; override with
+# the ``max_parallel_ddl`` profile setting.
+_MAX_DDL_WORKERS = 16
+
+# Idle connections kept per pool.
+_POOL_SIZE = 4
+
+
+class _ConnectionPool:
+    """Bounded pool of idle, authenticated Snowflake connections."""
+
+    def __init__(self, max_size: int = _POOL_SIZE) -> None:
+        self._idle: "queue.Queue[Any]" = queue.Queue(maxsize=max_size)
+
+    def acquire(self, factory: Callable[[], Any]) -> Any:
+        """Return an idle open connection, or open a new one with ``factory``."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return factory()
+            if not conn.is_closed():
+                return conn
+
+    def release(self, conn: Any) -> None:
+        """Return a connection to the pool, closing it if the pool is full."""
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close_all(self) -> None:
+        """Close every idle connection."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+
+def _credential_identity(cfg: Dict[str, Any]) -> str:
+    """Fingerprint the credential a profile logs in with, without keeping it."""
+    auth_method = cfg.get("auth_method", "username_password")
+    if auth_method == "username_password":
+        secret = cfg.get("password") or ""
+    elif auth_method == "ssh_key":
+        secret = (
+            f"{cfg.get('private_key_path')}\0{cfg.get('private_key_passphrase') or ''}"
+        )
+    else:
+        return ""
+    return hashlib.sha256(secret.encode("utf-8")).hexdigest()
+
+
+_POOLS: Dict[Tuple[Any, ...], _ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _get_pool(key: Tuple[Any, ...]) -> _ConnectionPool:
+    """Get the process-wide pool for a connection identity, creating it if needed."""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = _POOLS[key] = _ConnectionPool()
+        return pool
+
+
+@atexit.register
+def _close_pools() -> None:
+    """Log out every pooled session when the process exits."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close_all()
 
 
 class SnowflakeAdapter(DatabaseAdapter):
     """Snowflake database adapter implementation."""
 
+    def __init__(self, config: Dict[str, Any]) -> None:
+        super().__init__(config)
+        self._pool: Optional[_ConnectionPool] = None
+        self._ddl_cache: Optional[DDLCache] = None
+        self._object_listings: Dict[Tuple[str, ...], List[Tuple[Any, ...]]] = {}
+        # Schemas whose fingerprint counted no objects during this session
+        self._empty_schemas: Set[Tuple[str, str]] = set()
+        # get_* methods may be called from several threads on one adapter;
+        # only the first may open the session and the DDL cache
+        self._lock = threading.Lock()
+
     def connect(self) -> bool:
-        """Establish connection to Snowflake database."""
-        if not snowflake:
+        """
+        Check out a Snowflake connection from the shared pool.
+
+        Adapters with the same account, user, role, warehouse, auth method and
+        credential reuse an idle authenticated session instead of logging in
+        again. Does nothing if the adapter is already connected.
+        """
+        cfg = self.config
+        with self._lock:
+            if self._connection:
+                return True
+            pool = _get_pool(
+                (
+                    cfg.get("account"),
+                    cfg.get("username"),
+                    cfg.get("role"),
+                    cfg.get("warehouse"),
+                    cfg.get("auth_method", "username_password"),
+                    _credential_identity(cfg),
+                )
+            )
+            self._connection = pool.acquire(self._open_connection)
+            self._pool = pool
+        return True
+
+    def _open_connection(self) -> Any:
+        """Open a new authenticated Snowflake connection."""
+        if not _HAS_SNOWFLAKE:
             raise DatabaseConnectionError(
                 "snowflake-connector-python is not installed."
             )
@@ -48,9 +379,11 @@ class SnowflakeAdapter(DatabaseAdapter):
                     "Missing private_key_path for SSH key auth."
                 )
             try:
-                with open(private_key_path, "rb") as key_file:
-                    private_key = key_file.read()
-                conn_args["private_key"] = private_key
+                conn_args["private_key"] = _load_private_key(
+                    private_key_path,
+                    os.path.getmtime(private_key_path),
+                    cfg.get("private_key_passphrase"),
+                )
             except Exception as e:
                 raise DatabaseConnectionError(f"Failed to read private key: {e}")
         elif auth_method == "external_browser":
@@ -65,255 +398,501 @@ class SnowflakeAdapter(DatabaseAdapter):
         
         # Add insecure_mode for testing
         conn_args["insecure_mode"] = True
+        # Pooled sessions may sit idle between commands; keep them logged in.
+        conn_args["client_session_keep_alive"] = True
         
         try:
-            self._connection = snowflake.connector.connect(**conn_args)
-            return True
+            return snowflake.connector.connect(**conn_args)
         except Exception as e:
             raise DatabaseConnectionError(f"Failed to connect to Snowflake: {e}")
 
     def disconnect(self) -> None:
-        """Close the Snowflake database connection."""
+        """Return the connection to its pool, or close it if it was not pooled."""
+        self._object_listings.clear()
+        self._empty_schemas.clear()
+        if self._ddl_cache:
+            self._ddl_cache.close()
+            self._ddl_cache = None
         if self._connection:
             try:
-                self._connection.close()
+                if self._pool:
+                    self._pool.release(self._connection)
+                else:
+                    self._connection.close()
             except Exception:
                 pass
             self._connection = None
+            self._pool = None
 
-    def get_tables(self, database: str, schema: str) -> List[Dict[str, Any]]:
+    def get_tables(self, database: str, schema: str) -> List[DDLRecord]:
         """Get DDL for all tables in the specified database and schema."""
         return self._get_object_ddls(database, schema, "TABLE")
 
-    def get_views(self, database: str, schema: str) -> List[Dict[str, Any]]:
+    def iter_tables(self, database: str, schema: str) -> Iterator[DDLRecord]:
+        """
+        Stream DDL for all tables in the specified database and schema.
+
+        Records are yielded as result batches arrive, so callers that write
+        each one out straight away never hold every table's DDL at once.
+        """
+        return self._iter_object_ddls(database, schema, "TABLE")
+
+    def get_views(self, database: str, schema: str) -> List[DDLRecord]:
         """Get DDL for all views in the specified database and schema."""
         return self._get_object_ddls(database, schema, "VIEW")
 
     def get_materialized_views(
         self, database: str, schema: str
-    ) -> List[Dict[str, Any]]:
+    ) -> List[DDLRecord]:
         """Get DDL for all materialized views in the specified database and schema."""
-        # For materialized views, we need to use SHOW MATERIALIZED VIEWS
-        return self._get_materialized_view_ddls(database, schema)
+        return self._get_object_ddls(database, schema, "MATERIALIZED_VIEW")
 
-    def get_stages(self, database: str, schema: str) -> List[Dict[str, Any]]:
+    def get_stages(self, database: str, schema: str) -> List[DDLRecord]:
         """Get DDL for all stages in the specified database and schema."""
-        # For stages, we need to use SHOW CREATE STAGE instead of GET_DDL
+        # GET_DDL does not support stages, so the DDL is built from SHOW STAGES
         return self._get_stage_ddls(database, schema)
 
-    def get_snowpipes(self, database: str, schema: str) -> List[Dict[str, Any]]:
+    def get_snowpipes(self, database: str, schema: str) -> List[DDLRecord]:
         """Get DDL for all snow pipes in the specified database and schema."""
         return self._get_object_ddls(database, schema, "PIPE")
 
+    def get_all_objects(
+        self, database: str, schema: str
+    ) -> Dict[str, List[DDLRecord]]:
+        """
+        Get DDL for every supported object type with a fixed number of queries.
+
+        Tables, views, materialized views and pipes are listed by a single
+        UNION ALL catalog query and their DDL is fetched in shared GET_DDL
+        batches. Stages and procedures are rendered from their own catalog
+        queries, which run concurrently on other cursors. With the DDL cache
+        enabled, GET_DDL is only evaluated for objects that changed. A schema
+        that get_schema_fingerprint found empty is not queried again.
+        """
+        if (database, schema) in self._empty_schemas:
+            return {
+                object_type: []
+                for object_type in (*_CATALOG_SOURCES, "PROCEDURE", "STAGE")
+            }
+        if not self._connection:
+            self.connect()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            stages = executor.submit(self._get_stage_ddls, database, schema)
+            procedures = executor.submit(
+                self.get_stored_procedures, database, schema
+            )
+            objects = self._get_catalog_objects(database, schema)
+            objects["PROCEDURE"] = procedures.result()
+            objects["STAGE"] = stages.result()
+        return objects
+
+    def _get_catalog_objects(
+        self, database: str, schema: str
+    ) -> Dict[str, List[DDLRecord]]:
+        """
+        Fetch DDL for every GET_DDL-backed type from one listing query.
+
+        Returns:
+            Mapping of object type to its DDL records
+        """
+        self._list_all_objects(database, schema)
+        cache = self._get_ddl_cache()
+        listings: Dict[str, List[Tuple[Any, ...]]] = {}
+        cached: Dict[str, Dict[str, Tuple[str, str]]] = {}
+        pending: List[Tuple[str, Tuple[Any, ...]]] = []
+        for object_type in _CATALOG_SOURCES:
+            listing = listings[object_type] = self._list_objects(
+                database, schema, object_type
+            )
+            if cache is not None:
+                cached[object_type] = cache.get(database, schema, object_type)
+                listing = _stale_objects(listing, cached[object_type])
+            pending.extend((object_type, obj) for obj in listing)
+        fetched: Dict[str, Dict[str, DDLRecord]] = {
+            object_type: {} for object_type in _CATALOG_SOURCES
+        }
+        for record in self._iter_ddl_batches(database, schema, pending):
+            fetched[record.type][record.name] = record
+        if cache is None:
+            return {
+                object_type: list(records.values())
+                for object_type, records in fetched.items()
+            }
+        return {
+            object_type: self._merge_cached_ddls(
+                cache,
+                database,
+                schema,
+                object_type,
+                listings[object_type],
+                cached[object_type],
+                fetched[object_type],
+            )
+            for object_type in _CATALOG_SOURCES
+        }
+
+    def get_schema_fingerprint(self, database: str, schema: str) -> Optional[str]:
+        """
+        Get the object count and newest LAST_ALTERED of a schema in one query.
+
+        Returns:
+            "<count>:<last altered>" fingerprint, or None if the catalog could
+            not be read
+        """
+        if not self._connection:
+            self.connect()
+        params: Tuple[str, ...] = ()
+        for catalog_view in _FINGERPRINT_VIEWS:
+            params += (f"{database}.INFORMATION_SCHEMA.{catalog_view}", schema)
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(_FINGERPRINT_SQL, params)
+            row = cursor.fetchone()
+        except Exception:
+            return None
+        finally:
+            cursor.close()
+        if not row:
+            return None
+        count, last_altered = row
+        if count == 0:
+            self._empty_schemas.add((database, schema))
+        else:
+            self._empty_schemas.discard((database, schema))
+        return f"{count}:{last_altered}"
+
     def _get_object_ddls(
         self, database: str, schema: str, object_type: str
-    ) -> List[Dict[str, Any]]:
-        """Generic DDL extraction for a given object type."""
+    ) -> List[DDLRecord]:
+        """Fetch DDL for every object of a type."""
+        return list(self._iter_object_ddls(database, schema, object_type))
+
+    def _iter_object_ddls(
+        self, database: str, schema: str, object_type: str
+    ) -> Iterator[DDLRecord]:
+        """
+        Yield DDL for every object of a type.
+
+        The objects are listed from INFORMATION_SCHEMA, then their DDL is
+        fetched in batched GET_DDL statements. With the DDL cache enabled,
+        GET_DDL is only evaluated for objects that changed since they were
+        cached.
+        """
         if not self._connection:
             self.connect()
+        objects = self._list_objects(database, schema, object_type)
+        cache = self._get_ddl_cache()
+        if cache is None:
+            yield from self._iter_ddl_batches(
+                database, schema, [(object_type, obj) for obj in objects]
+            )
+            return
+
+        cached = cache.get(database, schema, object_type)
+        stale = _stale_objects(objects, cached)
+        fetched = {
+            record.name: record
+            for record in self._iter_ddl_batches(
+                database, schema, [(object_type, obj) for obj in stale]
+            )
+        }
+        yield from self._merge_cached_ddls(
+            cache, database, schema, object_type, objects, cached, fetched
+        )
+
+    def _merge_cached_ddls(
+        self,
+        cache: DDLCache,
+        database: str,
+        schema: str,
+        object_type: str,
+        objects: Sequence[Tuple[Any, ...]],
+        cached: Dict[str, Tuple[str, str]],
+        fetched: Dict[str, DDLRecord],
+    ) -> List[DDLRecord]:
+        """
+        Store freshly fetched DDL and combine it with cached DDL.
+
+        Args:
+            objects: Rows from _list_objects, which set the result order
+            cached: Cache entries read before fetching
+            fetched: Records fetched for the stale objects, by name
+        """
+        entries: List[Tuple[str, str, str]] = []
+        for obj_name, _, last_altered, _ in objects:
+            record = fetched.get(obj_name)
+            if record is not None and record.ddl:
+                entries.append((obj_name, str(last_altered), record.ddl))
+        if entries:
+            cache.put(database, schema, object_type, entries)
+
+        # Objects dropped between the probe and the fetch are in neither map.
+        return [
+            fetched[obj_name]
+            if obj_name in fetched
+            else DDLRecord(
+                obj_name, object_type, database, schema, cached[obj_name][1]
+            )
+            for obj_name, *_ in objects
+            if obj_name in fetched or obj_name in cached
+        ]
+
+    def _get_ddl_cache(self) -> Optional[DDLCache]:
+        """
+        Open the DDL cache on first use.
+
+        Returns None when the profile disables it with ``ddl_cache = false``.
+        """
+        with self._lock:
+            if self._ddl_cache is None and self.config.get("ddl_cache", True):
+                self._ddl_cache = DDLCache(
+                    self.config.get("ddl_cache_path"),
+                    self.config.get("account") or "",
+                )
+            return self._ddl_cache
+
+    def _list_objects(
+        self, database: str, schema: str, object_type: str
+    ) -> List[Tuple[Any, ...]]:
+        """
+        List (name, quoted FQN, LAST_ALTERED, definition) for objects of a type.
+
+        Listings are kept until disconnect(), so repeated probes of the same
+        schema within one session cost a single catalog query.
+        """
+        key = (database, schema, object_type)
+        if key in self._object_listings:
+            return self._object_listings[key]
+        catalog_view = _CATALOG_SOURCES[object_type][0]
         cursor = self._connection.cursor()
-        results = []
         try:
-            # Query for object names
-            cursor.execute(f"SHOW {object_type}s IN SCHEMA {database}.{schema}")
-            objects = cursor.fetchall()
-            name_idx = [desc[0].upper() for desc in cursor.description].index("NAME")
-            for obj in objects:
-                obj_name = obj[name_idx]
-                try:
-                    # Use GET_DDL function instead of SHOW CREATE
-                    cursor.execute(
-                        f"SELECT GET_DDL('{object_type}', '{database}.{schema}.{obj_name}')"
-                    )
-                    ddl_row = cursor.fetchone()
-                    ddl = ddl_row[0] if ddl_row else None
-                    results.append(
-                        {
-                            "name": obj_name,
-                            "type": object_type,
-                            "database": database,
-                            "schema": schema,
-                            "ddl": ddl,
-                        }
-                    )
-                except Exception as e:
-                    results.append(
-                        {
-                            "name": obj_name,
-                            "type": object_type,
-                            "database": database,
-                            "schema": schema,
-                            "ddl": None,
-                            "error": str(e),
-                        }
-                    )
+            cursor.execute(
+                _LIST_OBJECTS_SQL[object_type],
+                (f"{database}.INFORMATION_SCHEMA.{catalog_view}", schema),
+            )
+            objects = self._object_listings[key] = _fetch_rows_columnar(cursor)
+            return objects
         except Exception as e:
             raise DatabaseConnectionError(f"Failed to fetch {object_type}s: {e}")
         finally:
             cursor.close()
-        return results
 
-    def _get_stage_ddls(self, database: str, schema: str) -> List[Dict[str, Any]]:
-        """Get DDL for all stages using SHOW CREATE STAGE."""
-        if not self._connection:
-            self.connect()
+    def _list_all_objects(self, database: str, schema: str) -> None:
+        """
+        List every GET_DDL-backed object type of a schema with one catalog query.
+
+        The rows are split into the per-type listings that _list_objects
+        returns, so later probes of this schema do not query again.
+        """
+        keys = {
+            object_type: (database, schema, object_type)
+            for object_type in _CATALOG_SOURCES
+        }
+        if all(key in self._object_listings for key in keys.values()):
+            return
+        params: Tuple[str, ...] = ()
+        for catalog_view, _, _, _ in _CATALOG_SOURCES.values():
+            params += (f"{database}.INFORMATION_SCHEMA.{catalog_view}", schema)
         cursor = self._connection.cursor()
-        results = []
         try:
-            # Query for stage names
-            cursor.execute(f"SHOW STAGES IN SCHEMA {database}.{schema}")
-            stages = cursor.fetchall()
-            name_idx = [desc[0].upper() for desc in cursor.description].index("NAME")
-            for stage in stages:
-                stage_name = stage[name_idx]
-                try:
-                    # Use DESCRIBE STAGE for stages (SHOW CREATE doesn't work for stages)
-                    cursor.execute(f"DESCRIBE STAGE {database}.{schema}.{stage_name}")
-                    stage_info = cursor.fetchall()
-                    # Build DDL from stage description
-                    ddl_lines = [f"CREATE OR REPLACE STAGE {schema}.{stage_name}"]
-                    for row in stage_info:
-                        if row[0] == "URL":
-                            ddl_lines.append(f"URL = '{row[1]}'")
-                        elif row[0] == "STORAGE_INTEGRATION":
-                            ddl_lines.append(f"STORAGE_INTEGRATION = {row[1]}")
-                        elif row[0] == "CREDENTIALS":
-                            ddl_lines.append(f"CREDENTIALS = ({row[1]})")
-                    ddl = ";\n".join(ddl_lines) + ";"
-                    results.append(
-                        {
-                            "name": stage_name,
-                            "type": "STAGE",
-                            "database": database,
-                            "schema": schema,
-                            "ddl": ddl,
-                        }
-                    )
-                except Exception as e:
-                    results.append(
-                        {
-                            "name": stage_name,
-                            "type": "STAGE",
-                            "database": database,
-                            "schema": schema,
-                            "ddl": None,
-                            "error": str(e),
-                        }
-                    )
+            cursor.execute(_LIST_ALL_OBJECTS_SQL, params)
+            rows = _fetch_rows_columnar(cursor)
         except Exception as e:
-            # If no stages exist, return empty list
+            raise DatabaseConnectionError(f"Failed to list objects: {e}")
+        finally:
+            cursor.close()
+        listings: Dict[str, List[Tuple[Any, ...]]] = {
+            object_type: [] for object_type in keys
+        }
+        for object_type, *listing in rows:
+            listings[object_type].append(tuple(listing))
+        for object_type, key in keys.items():
+            self._object_listings[key] = listings[object_type]
+
+    def _iter_ddl_batches(
+        self,
+        database: str,
+        schema: str,
+        objects: Sequence[Tuple[str, Tuple[Any, ...]]],
+    ) -> Iterator[DDLRecord]:
+        """
+        Yield DDL for listed objects, _DDL_BATCH_SIZE objects per statement.
+
+        Objects whose listing already carries their definition are yielded
+        as is; GET_DDL is only evaluated for the rest.
+
+        Args:
+            database: Database name
+            schema: Schema name
+            objects: (object type, _list_objects row) pairs
+        """
+        pending: List[Tuple[str, Tuple[Any, ...]]] = []
+        for object_type, obj in objects:
+            if obj[3]:
+                yield DDLRecord(obj[0], object_type, database, schema, obj[3])
+            else:
+                pending.append((object_type, obj))
+        for start in range(0, len(pending), _DDL_BATCH_SIZE):
+            yield from self._fetch_ddl_batch(
+                database, schema, pending[start : start + _DDL_BATCH_SIZE]
+            )
+
+    def _fetch_ddl_batch(
+        self,
+        database: str,
+        schema: str,
+        objects: Sequence[Tuple[str, Tuple[Any, ...]]],
+    ) -> List[DDLRecord]:
+        """
+        Fetch DDL for a batch of listed objects in one statement.
+
+        Falls back to one GET_DDL query per object if the statement fails, so a
+        bad object only yields an error record.
+        """
+        params: List[Any] = []
+        for object_type, (obj_name, fqn, *_) in objects:
+            params += (object_type, obj_name, _CATALOG_SOURCES[object_type][2], fqn)
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(
+                " UNION ALL ".join([_DDL_BATCH_SELECT] * len(objects)), tuple(params)
+            )
+            return [
+                DDLRecord(obj_name, object_type, database, schema, ddl)
+                for object_type, obj_name, ddl in _iter_rows(cursor)
+            ]
+        except Exception:
+            # One failing GET_DDL aborts the whole statement; fetch the DDL
+            # one object at a time below instead.
             pass
-        cursor.close()
-        return results
+        finally:
+            cursor.close()
+        return self._map_objects(
+            lambda item: self._fetch_object_ddl(
+                database, schema, item[0], item[1][0], item[1][1]
+            ),
+            objects,
+        )
+
+    def _fetch_object_ddl(
+        self, database: str, schema: str, object_type: str, obj_name: str, fqn: str
+    ) -> DDLRecord:
+        """Run GET_DDL for a single object on its own cursor."""
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(
+                _SINGLE_DDL_SQL, (_CATALOG_SOURCES[object_type][2], fqn)
+            )
+            ddl_row = cursor.fetchone()
+            ddl = ddl_row[0] if ddl_row else None
+            return DDLRecord(obj_name, object_type, database, schema, ddl)
+        except Exception as e:
+            return DDLRecord(obj_name, object_type, database, schema, None, str(e))
+        finally:
+            cursor.close()
+
+    def _map_objects(
+        self, fetch_one: Callable[[Any], DDLRecord], objects: Sequence[Any]
+    ) -> List[DDLRecord]:
+        """
+        Run a per-object metadata query for every object concurrently.
+
+        Each call is blocked on a network round-trip, so they are fanned out
+        over a thread pool. Workers must open their own cursor; the connection
+        is shared. Results keep the order of ``objects``.
+        """
+        if not objects:
+            return []
+        max_workers = int(self.config.get("max_parallel_ddl", _MAX_DDL_WORKERS))
+        workers = max(1, min(max_workers, len(objects)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fetch_one, objects))
 
-    def _get_materialized_view_ddls(self, database: str, schema: str) -> List[Dict[str, Any]]:
-        """Get DDL for all materialized views using SHOW MATERIALIZED VIEWS."""
+    def _get_stage_ddls(self, database: str, schema: str) -> List[DDLRecord]:
+        """Get DDL for all stages from a single SHOW STAGES query."""
         if not self._connection:
             self.connect()
         cursor = self._connection.cursor()
-        results = []
         try:
-            # Query for materialized view names
-            cursor.execute(f"SHOW MATERIALIZED VIEWS IN SCHEMA {database}.{schema}")
-            views = cursor.fetchall()
-            name_idx = [desc[0].upper() for desc in cursor.description].index("NAME")
-            for view in views:
-                view_name = view[name_idx]
+            cursor.execute(_SHOW_STAGES_SQL.format(database=database, schema=schema))
+            columns = [desc[0].lower() for desc in cursor.description]
+            records: List[DDLRecord] = []
+            for row in _iter_rows(cursor):
+                stage = dict(zip(columns, row))
                 try:
-                    # Use GET_DDL for materialized views
-                    cursor.execute(f"SELECT GET_DDL('MATERIALIZED_VIEW', '{database}.{schema}.{view_name}')")
-                    ddl_row = cursor.fetchone()
-                    ddl = ddl_row[0] if ddl_row else None
-                    results.append(
-                        {
-                            "name": view_name,
-                            "type": "MATERIALIZED_VIEW",
-                            "database": database,
-                            "schema": schema,
-                            "ddl": ddl,
-                        }
-                    )
+                    ddl = _stage_ddl(schema, stage)
                 except Exception as e:
-                    results.append(
-                        {
-                            "name": view_name,
-                            "type": "MATERIALIZED_VIEW",
-                            "database": database,
-                            "schema": schema,
-                            "ddl": None,
-                            "error": str(e),
-                        }
+                    # Handle malformed or missing fields per stage
+                    records.append(
+                        DDLRecord(
+                            stage.get("name", ""),
+                            "STAGE",
+                            database,
+                            schema,
+                            None,
+                            str(e),
+                        )
+                    )
+                else:
+                    records.append(
+                        DDLRecord(stage["name"], "STAGE", database, schema, ddl)
                     )
+            return records
         except Exception as e:
-            # If no materialized views exist, return empty list
-            pass
-        cursor.close()
-        return results
+            raise DatabaseConnectionError(f"Failed to fetch STAGEs: {e}")
+        finally:
+            cursor.close()
+
+    def get_stored_procedures(
+        self, database: str, schema: str, name_pattern: str = "%"
+    ) -> List[DDLRecord]:
+        """
+        Get DDL for all stored procedures in the specified database and schema.
+
+        Args:
+            database: Database name
+            schema: Schema name
+            name_pattern: Optional ILIKE pattern to restrict procedure names
 
-    def get_stored_procedures(self, database: str, schema: str) -> List[Dict[str, Any]]:
-        """Get DDL for all stored procedures in the specified database and schema."""
+        Returns:
+            List of DDL records for each stored procedure
+        """
         if not self._connection:
             self.connect()
         cursor = self._connection.cursor()
-        results = []
         try:
-            # Get all procedures from information_schema
             cursor.execute(
-                f"SELECT PROCEDURE_NAME, ARGUMENT_SIGNATURE, PROCEDURE_LANGUAGE, PROCEDURE_DEFINITION, DATA_TYPE FROM {database}.INFORMATION_SCHEMA.PROCEDURES WHERE PROCEDURE_SCHEMA = %s",
-                (schema,),
+                _PROCEDURES_SQL,
+                (f"{database}.INFORMATION_SCHEMA.PROCEDURES", schema, name_pattern),
             )
-            procs = cursor.fetchall()
-            desc = [d[0].upper() for d in cursor.description]
-            idx_name = desc.index("PROCEDURE_NAME")
-            idx_args = desc.index("ARGUMENT_SIGNATURE")
-            idx_lang = desc.index("PROCEDURE_LANGUAGE")
-            idx_body = desc.index("PROCEDURE_DEFINITION")
-            idx_ret = desc.index("DATA_TYPE")
-            for proc in procs:
+            records: List[DDLRecord] = []
+            for row in _iter_rows(cursor):
                 try:
-                    name = proc[idx_name]
-                    args = proc[idx_args]
-                    lang = proc[idx_lang]
-                    body = proc[idx_body]
-                    ret = proc[idx_ret]
-                    # Reconstruct header - use relative schema.object name for portability
-                    header = f"CREATE OR REPLACE PROCEDURE {schema}.{name} {args}\nRETURNS {ret}\nLANGUAGE {lang}\nAS"
-                    # For SQL, body is not quoted; for JS/Python, may need $$
-                    if lang.upper() == "SQL":
-                        ddl = f"{header}\n{body.strip()}"
-                    else:
-                        # Use $$ for JS/Python
-                        ddl = f"{header}\n$$\n{body.strip()}\n$$"
-                    results.append(
-                        {
-                            "name": name,
-                            "type": "PROCEDURE",
-                            "database": database,
-                            "schema": schema,
-                            "language": lang,
-                            "ddl": ddl,
-                        }
-                    )
+                    ddl = _procedure_ddl(schema, *row)
                 except Exception as e:
-                    # Handle malformed or missing fields per-procedure
-                    name = proc[idx_name] if len(proc) > idx_name else None
-                    lang = proc[idx_lang] if len(proc) > idx_lang else None
-                    results.append(
-                        {
-                            "name": name,
-                            "type": "PROCEDURE",
-                            "database": database,
-                            "schema": schema,
-                            "language": lang,
-                            "ddl": None,
-                            "error": str(e),
-                        }
+                    # Handle malformed or missing fields per procedure
+                    records.append(
+                        DDLRecord(
+                            row[0],
+                            "PROCEDURE",
+                            database,
+                            schema,
+                            None,
+                            str(e),
+                            language=row[2] if len(row) > 2 else None,
+                        )
+                    )
+                else:
+                    records.append(
+                        DDLRecord(
+                            row[0], "PROCEDURE", database, schema, ddl, language=row[2]
+                        )
                     )
+            return records
         except Exception as e:
             raise DatabaseConnectionError(f"Failed to fetch procedures: {e}")
         finally:
             cursor.close()
-        return results
 
     def test_connection(self) -> bool:
         """Test the Snowflake database connection."""
@@ -337,8 +916,10 @@ class SnowflakeAdapter(DatabaseAdapter):
             cursor = self._connection.cursor()
             
             # Use Snowflake's CREATE DATABASE ... CLONE syntax
-            clone_sql = f"CREATE DATABASE {target_database} CLONE {source_database}"
-            cursor.execute(clone_sql)
+            cursor.execute(
+                "CREATE DATABASE IDENTIFIER(%s) CLONE IDENTIFIER(%s)",
+                (target_database, source_database),
+            )
             
             cursor.close()
             return True
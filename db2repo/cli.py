@@ -5,22 +5,79 @@ This module contains the Click CLI group and all command definitions.
 """
 
 import click
-from rich.console import Console
-from rich.text import Text
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from . import __version__
-from .config import ConfigManager
+from .config import ConfigManager, load_toml
 from .exceptions import ConfigurationError, DatabaseConnectionError
 from .git.manager import GitManager
-from .adapters import AdapterFactory
-from .utils.file_organization import write_ddl_file
+from .adapters import AdapterFactory, DDLRecord
+from .utils.file_organization import (
+    ddl_file_path_builder,
+    normalize_name,
+    write_file_if_changed,
+)
+from .utils.sync_manifest import load_fingerprint, load_manifest, save_manifest
 from .utils.validators import to_snowflake_name
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+class _LazyConsole:
+    """
+    Stand-in for the shared rich Console that imports rich on first use.
+
+    rich (and Pygments behind it) is only loaded by commands that print
+    through the console, keeping ``--version`` and ``version`` fast.
+    """
+
+    def __init__(self) -> None:
+        self._console: Optional["Console"] = None
+
+    def get(self) -> "Console":
+        """Return the real Console, creating it if needed."""
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return self._console
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get(), name)
+
+
+console = _LazyConsole()
+
+# Threads used by sync to write DDL files concurrently.
+_WRITE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Object types extracted by sync: (label, object type, adapter method name).
+_OBJECT_TYPES = (
+    ("Tables", "TABLE", "get_tables"),
+    ("Views", "VIEW", "get_views"),
+    ("Materialized Views", "MATERIALIZED_VIEW", "get_materialized_views"),
+    ("Stages", "STAGE", "get_stages"),
+    ("Snow Pipes", "PIPE", "get_snowpipes"),
+    ("Stored Procedures", "PROCEDURE", "get_stored_procedures"),
+)
+
+
+def _get_config() -> ConfigManager:
+    """
+    Return the ConfigManager for this invocation, loading it on first use.
+
+    It lives on the root context's ``obj`` so the config file is read and
+    parsed at most once however many commands ask for it.
+    """
+    obj: Dict[str, ConfigManager] = (
+        click.get_current_context().find_root().ensure_object(dict)
+    )
+    if "config" not in obj:
+        obj["config"] = ConfigManager()
+    return obj["config"]
 
 
 @click.group()
@@ -39,8 +96,7 @@ def cli() -> None:
 @cli.command()
 def version() -> None:
     """Show version information."""
-    version_text = Text(f"DB2Repo version {__version__}", style="bold blue")
-    console.print(version_text)
+    click.secho(f"DB2Repo version {__version__}", fg="blue", bold=True)
 
 
 @cli.command()
@@ -63,15 +119,19 @@ def profiles() -> None:
 def list() -> None:
     """List all available profiles."""
     try:
-        config = ConfigManager()
-        profile_list = config.list_profiles()
+        config = _get_config()
+        profiles_map = config.all_profiles()
         active_profile = config.get_active_profile()
 
-        if not profile_list:
-            console.print("No profiles configured.", style="yellow")
-            console.print("Use 'db2repo setup' to create your first profile.")
+        if not profiles_map:
+            console.print(
+                "[yellow]No profiles configured.[/yellow]\n"
+                "Use 'db2repo setup' to create your first profile."
+            )
             return
 
+        from rich.table import Table
+
         table = Table(title="Database Profiles")
         table.add_column("Profile Name", style="cyan", no_wrap=True)
         table.add_column("Platform", style="green")
@@ -79,8 +139,7 @@ def list() -> None:
         table.add_column("Schema", style="magenta")
         table.add_column("Status", style="bold")
 
-        for profile_name in profile_list:
-            profile = config.get_profile(profile_name)
+        for profile_name, profile in profiles_map.items():
             platform = profile.get("platform", "unknown")
             database = profile.get("database", "N/A")
             schema = profile.get("schema", "N/A")
@@ -112,7 +171,7 @@ def list() -> None:
 def use(profile_name: str) -> None:
     """Set the active profile."""
     try:
-        config = ConfigManager()
+        config = _get_config()
 
         if not config.profile_exists(profile_name):
             console.print(
@@ -136,7 +195,7 @@ def use(profile_name: str) -> None:
 def delete(profile_name: str) -> None:
     """Delete a profile."""
     try:
-        config = ConfigManager()
+        config = _get_config()
 
         if not config.profile_exists(profile_name):
             console.print(
@@ -161,10 +220,77 @@ def delete(profile_name: str) -> None:
 
 @cli.command()
 @click.option("--profile", "-p", help="Profile name to create/edit")
-def setup(profile: str) -> None:
-    """Set up a new database profile or edit an existing one."""
+@click.option(
+    "--account", help="Snowflake account", envvar="SNOWFLAKE_ACCOUNT", show_envvar=True
+)
+@click.option("--username", help="Username", envvar="SNOWFLAKE_USER", show_envvar=True)
+@click.option(
+    "--auth-method",
+    type=click.Choice(["username_password", "external_browser", "ssh_key"]),
+    help="Authentication method",
+)
+@click.option(
+    "--password",
+    help="Password (username_password auth)",
+    envvar="SNOWFLAKE_PASSWORD",
+    show_envvar=True,
+)
+@click.option(
+    "--private-key-path",
+    help="Private key file path (ssh_key auth)",
+    envvar="SNOWFLAKE_PRIVATE_KEY_PATH",
+    show_envvar=True,
+)
+@click.option(
+    "--private-key-passphrase",
+    help="Passphrase of an encrypted private key (ssh_key auth)",
+    envvar="SNOWFLAKE_PRIVATE_KEY_PASSPHRASE",
+    show_envvar=True,
+)
+@click.option(
+    "--warehouse", help="Warehouse", envvar="SNOWFLAKE_WAREHOUSE", show_envvar=True
+)
+@click.option(
+    "--database", help="Database", envvar="SNOWFLAKE_DATABASE", show_envvar=True
+)
+@click.option("--schema", help="Schema", envvar="SNOWFLAKE_SCHEMA", show_envvar=True)
+@click.option("--role", help="Role", envvar="SNOWFLAKE_ROLE", show_envvar=True)
+@click.option("--git-repo-path", help="Git repository path")
+@click.option("--git-remote-url", help="Git remote URL")
+@click.option("--git-branch", help="Git branch")
+@click.option("--git-author-name", help="Git author name")
+@click.option("--git-author-email", help="Git author email")
+@click.option(
+    "--ddl-cache/--no-ddl-cache",
+    default=None,
+    help="Reuse DDL of objects unchanged since the last sync (on by default)",
+)
+@click.option(
+    "--max-parallel-ddl",
+    type=click.IntRange(min=1),
+    help="Maximum concurrent per-object DDL queries",
+)
+@click.option(
+    "--from-file",
+    type=click.Path(exists=True, dir_okay=False),
+    help=(
+        "TOML file with profile settings; command-line options and "
+        "SNOWFLAKE_* variables win"
+    ),
+)
+@click.option("--yes", "-y", is_flag=True, help="Answer yes to all confirmations")
+def setup(profile: str, from_file: Optional[str], yes: bool, **options: Any) -> None:
+    """
+    Set up a new database profile or edit an existing one.
+
+    Settings passed as options, SNOWFLAKE_* environment variables or in
+    --from-file are not prompted for, so a profile can be created
+    non-interactively by supplying every field together with --yes.
+    """
     try:
-        config = ConfigManager()
+        config = _get_config()
+        if from_file:
+            _merge_profile_file(options, from_file)
         
         # Determine profile name
         if profile:
@@ -181,7 +307,7 @@ def setup(profile: str) -> None:
 
         # Check if profile exists
         if config.profile_exists(profile_name):
-            if not click.confirm(f"Profile '{profile_name}' already exists. Update it?"):
+            if not _confirm(f"Profile '{profile_name}' already exists. Update it?", yes):
                 console.print("Setup cancelled.")
                 return
 
@@ -195,69 +321,57 @@ def setup(profile: str) -> None:
         platform = "snowflake"  # For now, only Snowflake is supported
         
         # Snowflake-specific configuration
-        snowflake_config = _setup_snowflake_profile()
+        snowflake_config = _setup_snowflake_profile(options)
         
         # Git repository configuration
         console.print("\nGit Repository Configuration")
         console.print("-" * 30)
         
-        git_repo_path = click.prompt(
-            "Git repository path",
-            default="~/ddl-repo",
-            type=str
+        git_repo_path = _prompt_option(
+            options, "git_repo_path", "Git repository path", default="~/ddl-repo"
         )
         
-        git_remote_url = click.prompt(
-            "Git remote URL (optional)",
-            default="",
-            type=str
+        git_remote_url = _prompt_option(
+            options, "git_remote_url", "Git remote URL (optional)", default=""
         )
         
-        git_branch = click.prompt(
-            "Git branch",
-            default="main",
-            type=str
+        git_branch = _prompt_option(
+            options, "git_branch", "Git branch", default="main"
         )
         
-        git_author_name = click.prompt(
-            "Git author name",
-            default="DB2Repo User",
-            type=str
+        # Default the author to the identity git itself would use
+        default_author_name, default_author_email = None, None
+        if options.get("git_author_name") is None or options.get("git_author_email") is None:
+            default_author_name, default_author_email = GitManager.get_author_identity(git_repo_path)
+
+        git_author_name = _prompt_option(
+            options, "git_author_name", "Git author name", default=default_author_name or "DB2Repo User"
         )
         
-        git_author_email = click.prompt(
-            "Git author email",
-            default="user@example.com",
-            type=str
+        git_author_email = _prompt_option(
+            options, "git_author_email", "Git author email", default=default_author_email or "user@example.com"
         )
 
         # Validate git repository
         if not GitManager.is_git_repository(git_repo_path):
             if git_remote_url:
                 console.print(f"[yellow]The path '{git_repo_path}' is not a git repository.[/yellow]")
-                if click.confirm("Initialize a new git repository and add the remote?"):
-                    success = GitManager.initialize_repository(git_repo_path)
-                    if success:
-                        console.print(f"[green]Initialized new git repository at {git_repo_path}.[/green]")
-                        # TODO: Add remote URL to git config
-                        console.print(f"[yellow]Note: Remote URL '{git_remote_url}' will need to be added manually.[/yellow]")
-                    else:
-                        console.print(f"[red]Failed to initialize git repository at {git_repo_path}.[/red]")
-                        raise click.Abort()
-                else:
-                    console.print("Please clone the repository manually and rerun setup.")
-                    raise click.Abort()
+                question = "Initialize a new git repository and add the remote?"
+                cancel_message = "Please clone the repository manually and rerun setup."
             else:
-                if click.confirm(f"The path '{git_repo_path}' is not a git repository. Initialize a new git repo here?"):
-                    success = GitManager.initialize_repository(git_repo_path)
-                    if success:
-                        console.print(f"[green]Initialized new git repository at {git_repo_path}.[/green]")
-                    else:
-                        console.print(f"[red]Failed to initialize git repository at {git_repo_path}.[/red]")
-                        raise click.Abort()
-                else:
-                    console.print(f"[red]Setup cancelled. Please provide a valid git repository path.[/red]")
-                    raise click.Abort()
+                question = f"The path '{git_repo_path}' is not a git repository. Initialize a new git repo here?"
+                cancel_message = "[red]Setup cancelled. Please provide a valid git repository path.[/red]"
+
+            if not _confirm(question, yes):
+                console.print(cancel_message)
+                raise click.Abort()
+            if not GitManager.initialize_repository(git_repo_path):
+                console.print(f"[red]Failed to initialize git repository at {git_repo_path}.[/red]")
+                raise click.Abort()
+            console.print(f"[green]Initialized new git repository at {git_repo_path}.[/green]")
+            if git_remote_url:
+                # TODO: Add remote URL to git config
+                console.print(f"[yellow]Note: Remote URL '{git_remote_url}' will need to be added manually.[/yellow]")
 
         # Combine all configuration
         profile_config = {
@@ -270,15 +384,17 @@ def setup(profile: str) -> None:
             "git_author_email": git_author_email,
         }
 
-        # Save profile
-        config.set_profile(profile_name, profile_config)
-        
-        # Set as active if it's the first profile or user confirms
-        if config.get_profile_count() == 1 or click.confirm(f"Set '{profile_name}' as active profile?"):
-            config.set_active_profile(profile_name)
-            console.print(f"\n[bold green]Profile '{profile_name}' created and set as active[/bold green]")
-        else:
-            console.print(f"\n[bold green]Profile '{profile_name}' created[/bold green]")
+        # Save profile, writing the config file once together with the
+        # active profile change
+        with config.batch():
+            config.set_profile(profile_name, profile_config)
+            
+            # Set as active if it's the first profile or user confirms
+            if config.get_profile_count() == 1 or _confirm(f"Set '{profile_name}' as active profile?", yes):
+                config.set_active_profile(profile_name)
+                console.print(f"\n[bold green]Profile '{profile_name}' created and set as active[/bold green]")
+            else:
+                console.print(f"\n[bold green]Profile '{profile_name}' created[/bold green]")
 
         console.print(f"\nConfiguration saved to: {config.get_config_path()}")
 
@@ -290,10 +406,11 @@ def setup(profile: str) -> None:
 @cli.command()
 @click.option("--profile", "-p", help="Profile name to use (defaults to active profile)")
 @click.option("--dry-run", is_flag=True, help="Show what would be done without making changes")
-def branch_clone(profile: str, dry_run: bool) -> None:
+@click.option("--check-connection", is_flag=True, help="Test the database connection before cloning")
+def branch_clone(profile: str, dry_run: bool, check_connection: bool) -> None:
     """Create a new Git branch and clone the Snowflake database."""
     try:
-        config = ConfigManager()
+        config = _get_config()
         
         # Get the active profile
         if not profile:
@@ -322,7 +439,7 @@ def branch_clone(profile: str, dry_run: bool) -> None:
         
         # Initialize Git manager
         git_manager = GitManager(git_repo_path)
-        if not GitManager.is_git_repository(git_repo_path):
+        if git_manager.repo is None:
             console.print("[bold red]Not in a git repository.[/bold red]")
             console.print(f"Please navigate to a git repository: {git_repo_path}")
             raise click.Abort()
@@ -357,23 +474,23 @@ def branch_clone(profile: str, dry_run: bool) -> None:
         
         # Initialize database adapter to check if database exists
         adapter = AdapterFactory.get_adapter(profile_config)
+        click.get_current_context().call_on_close(adapter.disconnect)
         
-        # Test connection and attempt to clone database
-        console.print("[bold blue]Testing database connection...[/bold blue]")
+        # clone_database opens its own session and fails fast on bad
+        # credentials, so the connection is only probed separately on request
         try:
-            if adapter.test_connection():
+            if check_connection:
+                console.print("[bold blue]Testing database connection...[/bold blue]")
+                adapter.test_connection()
                 console.print("[bold green]Database connection successful.[/bold green]")
-                
-                # Attempt to clone the database
-                console.print(f"[bold blue]Attempting to clone database '{original_database}' to '{cloned_database}'...[/bold blue]")
-                if adapter.clone_database(original_database, cloned_database):
-                    console.print(f"[bold green]Successfully cloned database to '{cloned_database}'[/bold green]")
-                else:
-                    console.print(f"[bold yellow]Database cloning failed or database already exists.[/bold yellow]")
-                    console.print(f"[bold yellow]You may need to manually create database '{cloned_database}' in Snowflake.[/bold yellow]")
+
+            # Attempt to clone the database
+            console.print(f"[bold blue]Attempting to clone database '{original_database}' to '{cloned_database}'...[/bold blue]")
+            if adapter.clone_database(original_database, cloned_database):
+                console.print(f"[bold green]Successfully cloned database to '{cloned_database}'[/bold green]")
             else:
-                console.print("[bold red]Database connection failed.[/bold red]")
-                console.print(f"[bold yellow]Please ensure you can connect to Snowflake and manually create database '{cloned_database}' if needed.[/bold yellow]")
+                console.print(f"[bold yellow]Database cloning failed or database already exists.[/bold yellow]")
+                console.print(f"[bold yellow]You may need to manually create database '{cloned_database}' in Snowflake.[/bold yellow]")
         except Exception as e:
             console.print(f"[bold red]Database connection error:[/bold red] {e}")
             console.print(f"[bold yellow]Please manually create database '{cloned_database}' in Snowflake if needed.[/bold yellow]")
@@ -391,23 +508,27 @@ def branch_clone(profile: str, dry_run: bool) -> None:
 @click.option("--profile", "-p", help="Profile name to use (defaults to active profile)")
 @click.option("--dry-run", is_flag=True, help="Show what would be synced without making changes")
 @click.option("--commit", is_flag=True, help="Automatically commit changes to git")
-def sync(profile: str, dry_run: bool, commit: bool) -> None:
+@click.option("--cached", is_flag=True, help="With --dry-run, report the objects recorded by the last sync instead of querying the database")
+@click.option("--force", is_flag=True, help="Extract DDL even if the schema has not changed since the last sync")
+def sync(profile: str, dry_run: bool, commit: bool, cached: bool, force: bool) -> None:
     """Sync DDL from database to repository."""
     try:
-        config = ConfigManager()
+        config = _get_config()
         
         # Get profile configuration
         if profile:
             if not config.profile_exists(profile):
                 console.print(f"[bold red]Profile '{profile}' does not exist.[/bold red]")
                 raise click.Abort()
+            profile_name: Optional[str] = profile
             profile_config = config.get_profile(profile)
         else:
+            profile_name = config.get_active_profile()
             profile_config = config.get_active_profile_config()
-            if not profile_config:
-                console.print("[bold red]No active profile set.[/bold red]")
-                console.print("Use 'db2repo profiles use <name>' or 'db2repo setup' to configure a profile.")
-                raise click.Abort()
+        if not profile_name or not profile_config:
+            console.print("[bold red]No active profile set.[/bold red]")
+            console.print("Use 'db2repo profiles use <name>' or 'db2repo setup' to configure a profile.")
+            raise click.Abort()
 
         # Get git repository path
         git_repo_path = profile_config.get("git_repo_path")
@@ -416,22 +537,6 @@ def sync(profile: str, dry_run: bool, commit: bool) -> None:
             console.print("Run 'db2repo setup' to configure git repository settings.")
             raise click.Abort()
 
-        # Initialize database adapter
-        try:
-            adapter = AdapterFactory.get_adapter(profile_config)
-        except Exception as e:
-            console.print(f"[bold red]Failed to initialize database adapter:[/bold red] {e}")
-            raise click.Abort()
-
-        # Test connection (skip for now due to CFFI issues)
-        console.print("[bold blue]Testing database connection...[/bold blue]")
-        try:
-            # Skip connection test for now due to CFFI issues
-            console.print("[bold green]Database connection test skipped.[/bold green]")
-        except Exception as e:
-            console.print(f"[bold red]Database connection failed:[/bold red] {e}")
-            raise click.Abort()
-
         # Get database and schema from profile
         database = profile_config.get("database")
         schema = profile_config.get("schema")
@@ -440,16 +545,9 @@ def sync(profile: str, dry_run: bool, commit: bool) -> None:
             console.print("[bold red]Database or schema not configured in profile.[/bold red]")
             raise click.Abort()
 
-        # Get the active profile configuration
-        profile_config = config.get_profile(profile)
-        if not profile_config:
-            console.print(f"[bold red]Profile '{profile}' not found.[/bold red]")
-            raise click.Abort()
-
         # Check if we're on a feature branch and get the appropriate database
-        git_manager = GitManager(profile_config.get("git_repo_path"))
+        git_manager = GitManager(git_repo_path)
         current_branch = git_manager.get_current_branch()
-        database = profile_config.get("database")
         
         # Store the original database name for file organization
         original_database = database
@@ -460,112 +558,237 @@ def sync(profile: str, dry_run: bool, commit: bool) -> None:
             branch_database = f"{database}_{snowflake_branch_name}"
             console.print(f"[bold blue]Using branch-specific database: {branch_database}[/bold blue]")
             database = branch_database
-            # Update the adapter's configuration to use the branch-specific database
-            profile_config["database"] = database
+            # Point the adapter at the branch-specific database without
+            # changing the loaded profile
+            profile_config = {**profile_config, "database": database}
         else:
             console.print(f"[bold blue]Using main database: {database}[/bold blue]")
-        
-        schema = profile_config.get("schema")
-        if not schema:
-            console.print("[bold red]Schema not configured in profile.[/bold red]")
-            raise click.Abort()
 
         console.print(f"\n[bold blue]Syncing DDL from {database}.{schema}[/bold blue]")
         
         if dry_run:
             console.print("[yellow]DRY RUN MODE - No files will be written[/yellow]")
 
-        # Initialize git manager
-        git_manager = GitManager(git_repo_path)
-        
+        # A cached dry run is answered from the last sync's manifest, without
+        # loading the adapter or connecting to the database
+        if dry_run and cached:
+            manifest = load_manifest(profile_name, database, schema)
+            if manifest is not None:
+                cached_total = 0
+                console.print(f"\n[bold]Objects recorded by the last sync:[/bold]")
+                for object_type, entries in sorted(manifest.items()):
+                    console.print(f"  {object_type}: {len(entries)}")
+                    cached_total += len(entries)
+                console.print(f"  Total objects: {cached_total}")
+                console.print(f"\n[yellow]Dry run completed from cache. No database queries were made.[/yellow]")
+                return
+            console.print("[yellow]No cached sync found; querying the database.[/yellow]")
+
+        # Initialize database adapter
+        try:
+            adapter = AdapterFactory.get_adapter(profile_config)
+        except Exception as e:
+            console.print(f"[bold red]Failed to initialize database adapter:[/bold red] {e}")
+            raise click.Abort()
+        # The adapter keeps one session for every query this sync makes and
+        # hands it back to the pool however the command exits
+        click.get_current_context().call_on_close(adapter.disconnect)
+
+        # Test connection (skip for now due to CFFI issues)
+        console.print("[bold blue]Testing database connection...[/bold blue]")
+        try:
+            # Skip connection test for now due to CFFI issues
+            console.print("[bold green]Database connection test skipped.[/bold green]")
+        except Exception as e:
+            console.print(f"[bold red]Database connection failed:[/bold red] {e}")
+            raise click.Abort()
+
+        # Skip extraction entirely if nothing in the schema changed since the
+        # last sync. The fingerprint is read before extraction so changes made
+        # while syncing are picked up next time.
+        try:
+            fingerprint = adapter.get_schema_fingerprint(database, schema)
+        except Exception:
+            fingerprint = None
+        # Synced files live under one directory per database
+        database_dir = str(Path(git_repo_path).expanduser() / normalize_name(original_database))
+        # Dry runs always report from the database, and so does a sync whose
+        # output tree was deleted or edited since the last one
+        if (
+            not force
+            and not dry_run
+            and fingerprint is not None
+            and fingerprint == load_fingerprint(profile_name, database, schema)
+            and _has_synced_files(database_dir)
+            and not _has_uncommitted_changes(git_manager, database_dir)
+        ):
+            console.print(f"\n[green]Nothing changed in {database}.{schema} since the last sync.[/green]")
+            console.print("Use --force to extract DDL anyway.")
+            return
+
         # Track files for git commit
         files_to_commit = []
+        synced_objects = []
         
         # Progress tracking
+        from concurrent.futures import ThreadPoolExecutor
+
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        # Without a terminal (CI logs, pipes) the spinner would only be
+        # discarded, so no live display or refresh thread is started
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console
+            console=console.get(),
+            transient=True,
+            disable=not console.is_terminal,
         ) as progress:
             
-            # Extract and save DDL for each object type
-            object_types = [
-                ("Tables", adapter.get_tables),
-                ("Views", adapter.get_views),
-                ("Materialized Views", adapter.get_materialized_views),
-                ("Stages", adapter.get_stages),
-                ("Snow Pipes", adapter.get_snowpipes),
-                ("Stored Procedures", adapter.get_stored_procedures),
-            ]
-            
             total_objects = 0
             successful_objects = 0
             failed_objects = 0
+            unchanged_objects = 0
+            # Printed after the progress display closes, so errors do not
+            # force a redraw of the live display each time
+            errors = []
+
+            # Fetch every object type in as few round trips as the adapter
+            # allows; if that fails, each type is retried on its own below so
+            # one bad type does not hide the others.
+            task = progress.add_task("Extracting DDL...", total=len(_OBJECT_TYPES))
+            try:
+                objects_by_type = adapter.get_all_objects(database, schema)
+            except Exception:
+                objects_by_type = {}
+
+            # Types the combined fetch did not cover are fetched concurrently,
+            # since each is mostly spent waiting on the database
+            missing = [
+                (object_type, method_name)
+                for _, object_type, method_name in _OBJECT_TYPES
+                if objects_by_type.get(object_type) is None
+            ]
+            fetches = {}
+            if missing:
+                with ThreadPoolExecutor(max_workers=len(missing)) as fetcher:
+                    fetches = {
+                        object_type: fetcher.submit(getattr(adapter, method_name), database, schema)
+                        for object_type, method_name in missing
+                    }
+
+            # File writes are blocking I/O, so they overlap on a thread pool
+            # while the remaining object types are processed.
+            with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as writer:
+                pending_writes = []
+                # Always use the original database name for file organization
+                ddl_file_path = ddl_file_path_builder(git_repo_path, original_database, schema)
             
-            for object_type_name, extract_method in object_types:
-                progress.add_task(f"Extracting {object_type_name}...", total=None)
+                # Extract and save DDL for each object type
+                for object_type_name, object_type, _ in _OBJECT_TYPES:
+                    progress.update(task, description=f"Extracting {object_type_name}...")
                 
-                try:
-                    objects = extract_method(database, schema)
+                    objects = objects_by_type.get(object_type)
+                    if objects is None:
+                        # Only a failed fetch of a whole type raises; per-object
+                        # failures come back as records with an error set
+                        try:
+                            objects = fetches[object_type].result()
+                        except Exception as e:
+                            errors.append(f"[red]Error extracting {object_type_name}: {e}[/red]")
+                            failed_objects += 1
+                            progress.advance(task)
+                            continue
                     total_objects += len(objects)
-                    
+
+                    # Records that map to the same file (overloaded procedures,
+                    # names that only differ in case) are written once, with the
+                    # last record's DDL, so no two writers race on one path
+                    records_by_path: Dict[Path, List[DDLRecord]] = {}
+                    ddl_by_path: Dict[Path, str] = {}
                     for obj in objects:
-                        if obj.get("error"):
+                        if obj.error:
                             failed_objects += 1
-                            console.print(f"[red]Error extracting {obj['type']} {obj['name']}: {obj['error']}[/red]")
+                            errors.append(f"[red]Error extracting {obj.type} {obj.name}: {obj.error}[/red]")
                             continue
-                            
-                        if not obj.get("ddl"):
+                        
+                        if not obj.ddl:
                             failed_objects += 1
-                            console.print(f"[red]No DDL found for {obj['type']} {obj['name']}[/red]")
+                            errors.append(f"[red]No DDL found for {obj.type} {obj.name}[/red]")
                             continue
-                        
-                        # Determine file path - always use original database name for file organization
-                        file_path = write_ddl_file(
-                            base_dir=git_repo_path,
-                            database=original_database,
-                            schema=schema,
-                            object_type=obj["type"],
-                            object_name=obj["name"],
-                            ddl=obj["ddl"],
-                            overwrite=True
+                    
+                        if dry_run:
+                            successful_objects += 1
+                            continue
+
+                        file_path = ddl_file_path(obj.type, obj.name)
+                        records_by_path.setdefault(file_path, []).append(obj)
+                        ddl_by_path[file_path] = obj.ddl
+
+                    # Files whose content is unchanged are not rewritten
+                    for file_path, records in records_by_path.items():
+                        pending_writes.append(
+                            (records, file_path, writer.submit(write_file_if_changed, file_path, ddl_by_path[file_path]))
                         )
-                        
-                        if not dry_run:
+                    progress.advance(task)
+
+                # Collect the writes in submission order so output stays stable
+                for records, file_path, future in pending_writes:
+                    try:
+                        if future.result():
                             files_to_commit.append(str(file_path))
-                        
-                        successful_objects += 1
-                        
-                except Exception as e:
-                    console.print(f"[red]Error extracting {object_type_name}: {e}[/red]")
-                    failed_objects += 1
+                        else:
+                            unchanged_objects += len(records)
+                        synced_objects.extend(records)
+                        successful_objects += len(records)
+                    except Exception as e:
+                        failed_objects += len(records)
+                        errors.extend(
+                            f"[red]Error writing {obj.type} {obj.name}: {e}[/red]"
+                            for obj in records
+                        )
+
+        # Errors and the summary are rendered in one print each rather than
+        # one per line
+        if errors:
+            console.print("\n".join(errors))
 
         # Summary
-        console.print(f"\n[bold]Sync Summary:[/bold]")
-        console.print(f"  Total objects: {total_objects}")
-        console.print(f"  Successful: [green]{successful_objects}[/green]")
-        console.print(f"  Failed: [red]{failed_objects}[/red]")
+        summary = [
+            f"\n[bold]Sync Summary:[/bold]",
+            f"  Total objects: {total_objects}",
+            f"  Successful: [green]{successful_objects}[/green]",
+            f"  Failed: [red]{failed_objects}[/red]",
+        ]
+        if not dry_run:
+            summary.append(f"  Unchanged: {unchanged_objects}")
+        console.print("\n".join(summary))
         
         if dry_run:
             console.print(f"\n[yellow]Dry run completed. No files were written.[/yellow]")
             return
 
-        # Git operations
-        if files_to_commit and commit:
-            console.print(f"\n[bold blue]Committing changes to git...[/bold blue]")
-            try:
-                # Add files to git
-                if git_manager.add_files(files_to_commit):
-                    # Commit changes
-                    commit_message = f"Sync DDL from {database}.{schema} - {successful_objects} objects"
-                    if git_manager.commit_changes(commit_message):
-                        console.print(f"[bold green]Changes committed to git.[/bold green]")
-                    else:
-                        console.print(f"[yellow]Git commit failed.[/yellow]")
-                else:
-                    console.print(f"[yellow]Git add failed.[/yellow]")
-            except Exception as e:
-                console.print(f"[red]Git operation failed: {e}[/red]")
+        try:
+            # A sync with failures records no fingerprint, so it is retried
+            save_manifest(
+                profile_name,
+                database,
+                schema,
+                synced_objects,
+                fingerprint=None if failed_objects else fingerprint,
+            )
+        except OSError as e:
+            console.print(f"[yellow]Could not record sync manifest: {e}[/yellow]")
+
+        # Git operations. Files an earlier sync wrote but did not commit
+        # are committed too, even if this run left them unchanged.
+        if commit and (files_to_commit or _has_uncommitted_changes(git_manager, database_dir)):
+            _commit_synced_ddl(
+                git_manager,
+                database_dir,
+                f"Sync DDL from {database}.{schema} - {successful_objects} objects",
+                profile_config,
+            )
         elif files_to_commit:
             console.print(f"\n[bold yellow]Files written but not committed.[/bold yellow]")
             console.print(f"Run 'git add . && git commit -m \"Sync DDL\"' in {git_repo_path} to commit changes.")
@@ -577,12 +800,86 @@ def sync(profile: str, dry_run: bool, commit: bool) -> None:
         raise click.Abort()
 
 
-def _setup_snowflake_profile() -> dict:
-    """Set up Snowflake-specific configuration."""
-    account = click.prompt("Snowflake account", type=str)
-    username = click.prompt("Username", type=str)
+def _has_synced_files(database_dir: str) -> bool:
+    """Return whether any file exists under the synced database directory."""
+    return any(path.is_file() for path in Path(database_dir).rglob("*"))
+
+
+def _has_uncommitted_changes(git_manager: GitManager, path: str) -> bool:
+    """Return whether path has uncommitted changes, treating git errors as none."""
+    try:
+        return git_manager.has_changes(path)
+    except Exception:
+        return False
+
+
+def _commit_synced_ddl(
+    git_manager: GitManager, database_dir: str, message: str, profile_config: Dict[str, Any]
+) -> None:
+    """Stage the synced database directory and commit it, reporting the outcome."""
+    console.print(f"\n[bold blue]Committing changes to git...[/bold blue]")
+    try:
+        # Stage the synced database directory with a single git add
+        if git_manager.add_all(database_dir):
+            if git_manager.commit_changes(
+                message,
+                author_name=profile_config.get("git_author_name"),
+                author_email=profile_config.get("git_author_email"),
+            ):
+                console.print(f"[bold green]Changes committed to git.[/bold green]")
+            else:
+                console.print(f"[yellow]Git commit failed.[/yellow]")
+        else:
+            console.print(f"[yellow]Git add failed.[/yellow]")
+    except Exception as e:
+        console.print(f"[red]Git operation failed: {e}[/red]")
+
+
+def _prompt_option(options: Dict[str, Any], key: str, text: str, **kwargs: Any) -> Any:
+    """Return the value given on the command line for ``key``, or prompt for it."""
+    value = options.get(key)
+    if value is not None:
+        return value
+    return click.prompt(text, type=kwargs.pop("type", str), **kwargs)
+
+
+def _merge_profile_file(options: Dict[str, Any], path: str) -> None:
+    """Fill setup options that were not given on the command line from a TOML file."""
+    try:
+        values = load_toml(Path(path))
+    except ValueError as e:
+        raise click.BadParameter(f"Invalid TOML: {e}", param_hint="--from-file")
+    values.pop("platform", None)
+    unknown = sorted(set(values) - set(options))
+    if unknown:
+        raise click.BadParameter(
+            f"Unknown profile settings: {', '.join(unknown)}", param_hint="--from-file"
+        )
+    for key, value in values.items():
+        if options.get(key) is None:
+            # Flags and counts keep their TOML type; "false" would be truthy
+            options[key] = value if isinstance(value, (bool, int)) else str(value)
+
+
+def _confirm(text: str, assume_yes: bool) -> bool:
+    """Ask for confirmation unless --yes was given."""
+    return assume_yes or click.confirm(text)
+
+
+def _setup_snowflake_profile(options: Optional[Dict[str, Any]] = None) -> dict:
+    """
+    Set up Snowflake-specific configuration.
+
+    Args:
+        options: Values given as setup options; only missing ones are prompted for
+    """
+    options = options or {}
+    account = _prompt_option(options, "account", "Snowflake account")
+    username = _prompt_option(options, "username", "Username")
     
-    auth_method = click.prompt(
+    auth_method = _prompt_option(
+        options,
+        "auth_method",
         "Authentication method",
         type=click.Choice(["username_password", "external_browser", "ssh_key"]),
         default="username_password"
@@ -595,24 +892,35 @@ def _setup_snowflake_profile() -> dict:
     }
     
     if auth_method == "username_password":
-        config["password"] = click.prompt("Password", type=str, hide_input=True)
+        config["password"] = _prompt_option(
+            options, "password", "Password", hide_input=True
+        )
     elif auth_method == "ssh_key":
-        config["private_key_path"] = click.prompt("Private key file path", type=str)
+        config["private_key_path"] = _prompt_option(
+            options, "private_key_path", "Private key file path"
+        )
+        if options.get("private_key_passphrase"):
+            config["private_key_passphrase"] = options["private_key_passphrase"]
     
     # Optional fields
-    warehouse = click.prompt("Warehouse (optional)", default="", type=str)
+    warehouse = _prompt_option(options, "warehouse", "Warehouse (optional)", default="")
     if warehouse:
         config["warehouse"] = warehouse
     
-    database = click.prompt("Database", type=str)
+    database = _prompt_option(options, "database", "Database")
     config["database"] = database
     
-    schema = click.prompt("Schema", type=str)
+    schema = _prompt_option(options, "schema", "Schema")
     config["schema"] = schema
     
-    role = click.prompt("Role (optional)", default="", type=str)
+    role = _prompt_option(options, "role", "Role (optional)", default="")
     if role:
         config["role"] = role
-    
+
+    # Tuning settings are stored only when given; they are never prompted for
+    for key in ("ddl_cache", "max_parallel_ddl"):
+        if options.get(key) is not None:
+            config[key] = options[key]
+
     return config
  
\ No newline at end of file
@@ -5,14 +5,66 @@ This module handles loading, saving, and managing configuration files
 in TOML format with profile-based settings.
 """
 
+import copy
 import os
+import stat
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import toml
 
 from .exceptions import ConfigurationError
 
+try:
+    import tomllib  # type: ignore  # not in the Python 3.8 typeshed
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+# Parsed config files keyed by (path, st_mtime_ns, st_size), so a file that
+# has not changed is parsed once per process. Entries are private copies and
+# every ConfigManager gets its own deepcopy, so edits cannot leak between them.
+_PARSED_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+_PARSED_CACHE_LOCK = threading.Lock()
+
+
+# Fields every profile of a platform must set, checked in this order, with the
+# platform's display name for error messages.
+_PLATFORM_REQUIRED_FIELDS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "snowflake": ("Snowflake", ("account", "username", "database", "schema")),
+}
+
+
+def _cache_parsed(path: Path, config: Dict[str, Any]) -> None:
+    """Remember the parsed contents of path as of its current stat."""
+    st = path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    with _PARSED_CACHE_LOCK:
+        for stale in [k for k in _PARSED_CACHE if k[0] == key[0]]:
+            del _PARSED_CACHE[stale]
+        _PARSED_CACHE[key] = copy.deepcopy(config)
+
+
+def load_toml(path: Path) -> Dict[str, Any]:
+    """
+    Parse a TOML file.
+
+    Uses the standard library's tomllib where available, which parses
+    several times faster than the toml package; toml is the fallback on
+    older Pythons and is still used for writing.
+
+    Raises:
+        ValueError: If the file is not valid TOML
+    """
+    config: Dict[str, Any]
+    if tomllib is None:
+        config = toml.load(path)
+    else:
+        with open(path, "rb") as f:
+            config = tomllib.load(f)
+    return config
+
 
 class ConfigManager:
     """Manages configuration files and profiles for DB2Repo."""
@@ -29,18 +81,30 @@ class ConfigManager:
 
         self.config_path = Path(config_path)
         self._config: Dict[str, Any] = {}
+        self._in_batch = False
+        self._dirty = False
         self._load_config()
 
     def _load_config(self) -> None:
         """Load configuration from file."""
-        if self.config_path.exists():
-            try:
-                self._config = toml.load(self.config_path)
-                self._validate_config_structure()
-            except toml.TomlDecodeError as e:
-                raise ConfigurationError(f"Invalid TOML configuration file: {e}")
-        else:
+        try:
+            st = self.config_path.stat()
+        except FileNotFoundError:
             self._config = {}
+            return
+
+        with _PARSED_CACHE_LOCK:
+            cached = _PARSED_CACHE.get((str(self.config_path), st.st_mtime_ns, st.st_size))
+        if cached is not None:
+            self._config = copy.deepcopy(cached)
+            return
+
+        try:
+            self._config = load_toml(self.config_path)
+            self._validate_config_structure()
+        except ValueError as e:
+            raise ConfigurationError(f"Invalid TOML configuration file: {e}")
+        _cache_parsed(self.config_path, self._config)
 
     def _validate_config_structure(self) -> None:
         """Validate the basic structure of the configuration."""
@@ -58,12 +122,57 @@ class ConfigManager:
                 )
 
     def _save_config(self) -> None:
-        """Save configuration to file."""
+        """
+        Save configuration to file.
+
+        The file is written to a temporary sibling and moved into place, so
+        readers never see a partly written config. Inside batch() the write
+        is deferred until the batch ends.
+        """
+        if self._in_batch:
+            self._dirty = True
+            return
+
         # Ensure directory exists
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(self.config_path, "w") as f:
+        try:
+            # Keep the permissions of the existing file; it may hold secrets
+            mode = stat.S_IMODE(self.config_path.stat().st_mode)
+        except FileNotFoundError:
+            mode = 0o600
+
+        # The temporary file gets its final permissions before anything is
+        # written to it, so credentials are never readable by other users
+        tmp_path = self.config_path.with_name(self.config_path.name + ".tmp")
+        tmp_path.unlink(missing_ok=True)  # left over from an interrupted save
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+        with os.fdopen(fd, "w") as f:
+            # os.open applies the umask; restore the exact mode being kept
+            os.chmod(tmp_path, mode)
             toml.dump(self._config, f)
+        os.replace(tmp_path, self.config_path)
+        _cache_parsed(self.config_path, self._config)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group several changes into a single write of the config file.
+
+        Changes made inside the block are saved once when it exits, including
+        when it exits with an exception, so completed changes are not lost.
+        """
+        if self._in_batch:
+            yield
+            return
+        self._in_batch = True
+        try:
+            yield
+        finally:
+            self._in_batch = False
+            if self._dirty:
+                self._dirty = False
+                self._save_config()
 
     def get_active_profile(self) -> Optional[str]:
         """Get the currently active profile name."""
@@ -74,14 +183,22 @@ class ConfigManager:
         self._config["active_profile"] = profile_name
         self._save_config()
 
+    def _get_profile_entry(self, profile_name: str) -> Optional[Dict[str, Any]]:
+        """Look up a profile, never treating the active_profile key as one."""
+        if profile_name == "active_profile":
+            return None
+        return self._config.get(profile_name)
+
     def get_profile(self, profile_name: str) -> Optional[Dict[str, Any]]:
         """Get configuration for a specific profile."""
-        return self._config.get(profile_name)
+        return self._get_profile_entry(profile_name)
 
     def set_profile(self, profile_name: str, profile_config: Dict[str, Any]) -> None:
         """Set configuration for a specific profile."""
         if not profile_name or not isinstance(profile_name, str):
             raise ConfigurationError("Profile name must be a non-empty string")
+        if profile_name == "active_profile":
+            raise ConfigurationError("Profile name 'active_profile' is reserved")
 
         # Validate profile configuration
         self._validate_profile_config(profile_config)
@@ -97,9 +214,17 @@ class ConfigManager:
                 profiles.append(key)
         return sorted(profiles)
 
+    def all_profiles(self) -> Dict[str, Dict[str, Any]]:
+        """Get every profile's configuration keyed by profile name, sorted by name."""
+        return {
+            name: self._config[name]
+            for name in sorted(self._config)
+            if name != "active_profile"
+        }
+
     def delete_profile(self, profile_name: str) -> None:
         """Delete a profile."""
-        if profile_name not in self._config:
+        if not self.profile_exists(profile_name):
             raise ConfigurationError(f"Profile '{profile_name}' does not exist")
 
         # Don't allow deletion of the active profile
@@ -134,13 +259,14 @@ class ConfigManager:
             raise ConfigurationError("Platform must be a non-empty string")
 
         # Validate platform-specific required fields
-        if platform.lower() == "snowflake":
-            snowflake_required = ["account", "username", "database", "schema"]
-            for field in snowflake_required:
-                if field not in profile_config:
-                    raise ConfigurationError(
-                        f"Snowflake profile missing required field: {field}"
-                    )
+        label, platform_required = _PLATFORM_REQUIRED_FIELDS.get(
+            platform.lower(), (None, ())
+        )
+        for field in platform_required:
+            if field not in profile_config:
+                raise ConfigurationError(
+                    f"{label} profile missing required field: {field}"
+                )
 
     def validate_profile(self, profile_name: str) -> List[str]:
         """Validate a specific profile and return list of errors."""
@@ -167,9 +293,9 @@ class ConfigManager:
 
     def profile_exists(self, profile_name: str) -> bool:
         """Check if a profile exists."""
-        return profile_name in self._config
+        return self._get_profile_entry(profile_name) is not None
 
     def get_profile_count(self) -> int:
         """Get the total number of profiles."""
-        return len(self.list_profiles())
+        return len(self._config) - ("active_profile" in self._config)
  
\ No newline at end of file
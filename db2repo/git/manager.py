@@ -5,15 +5,15 @@ This module handles git operations and repository management.
 """
 
 from pathlib import Path
-from typing import Optional, List
-import subprocess
-from git import Repo, InvalidGitRepositoryError, NoSuchPathError, GitCommandError
+from typing import Dict, Optional, List, Tuple
 
 
 class GitManager:
     """Manages git operations for DDL repositories."""
 
     def __init__(self, repo_path: str) -> None:
+        from git import InvalidGitRepositoryError, NoSuchPathError, Repo
+
         self.repo_path = Path(repo_path).expanduser().resolve()
         try:
             self.repo = Repo(str(self.repo_path))
@@ -23,14 +23,50 @@ class GitManager:
     @staticmethod
     def is_git_repository(path: str) -> bool:
         repo_path = Path(path).expanduser().resolve()
+        # A plain .git directory is the common case and needs no repository
+        # open. Only a .git file (worktree, submodule) or a HEAD file (bare
+        # repository) needs GitPython to decide; anything else is not a repo.
+        git_entry = repo_path / ".git"
+        if git_entry.is_dir():
+            return True
+        if not git_entry.is_file() and not (repo_path / "HEAD").is_file():
+            return False
+
+        from git import InvalidGitRepositoryError, NoSuchPathError, Repo
+
         try:
             _ = Repo(str(repo_path))
             return True
         except (InvalidGitRepositoryError, NoSuchPathError):
             return False
 
+    @staticmethod
+    def get_author_identity(path: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Read user.name and user.email from git config without running git.
+
+        Uses the merged config (repository-local first, then global) of the
+        repository containing path, and the global config if there is none.
+        """
+        from git import GitConfigParser, InvalidGitRepositoryError, NoSuchPathError, Repo
+        from git.config import get_config_path
+
+        try:
+            reader = Repo(
+                str(Path(path).expanduser().resolve()), search_parent_directories=True
+            ).config_reader()
+        except (InvalidGitRepositoryError, NoSuchPathError):
+            reader = GitConfigParser(get_config_path("global"), read_only=True)
+        name, email = (
+            str(reader.get_value("user", key)) if reader.has_option("user", key) else None
+            for key in ("name", "email")
+        )
+        return name, email
+
     @staticmethod
     def initialize_repository(path: str) -> bool:
+        from git import Repo
+
         repo_path = Path(path).expanduser().resolve()
         repo_path.mkdir(parents=True, exist_ok=True)
         try:
@@ -40,46 +76,127 @@ class GitManager:
             return False
 
     def get_status(self) -> dict:
+        from git import GitCommandError, InvalidGitRepositoryError
+
         if not self.repo:
             raise InvalidGitRepositoryError(f"Not a git repository: {self.repo_path}")
         try:
-            changed = [item.a_path for item in self.repo.index.diff(None)]
-            untracked = self.repo.untracked_files
-            branch = self.repo.active_branch.name if self.repo.head.is_valid() else None
+            # One porcelain v2 status call replaces the separate diff,
+            # untracked and dirty-check commands GitPython would run
+            output = self.repo.git.status(
+                "--porcelain=v2", "-z", "--branch", "--untracked-files=all"
+            )
+            changed: List[str] = []
+            untracked: List[str] = []
+            branch: Optional[str] = None
+            unborn = False
+            is_dirty = False
+            records = iter(output.split("\0"))
+            for record in records:
+                kind = record[:1]
+                if record.startswith("# branch.head "):
+                    branch = record[len("# branch.head "):]
+                elif record == "# branch.oid (initial)":
+                    unborn = True
+                elif kind == "?":
+                    untracked.append(record[2:])
+                elif kind in ("1", "2", "u"):
+                    # Ordinary, renamed/copied and unmerged entries have 8, 9
+                    # and 10 fields before the path; XY is the second field
+                    fields = record.split(" ", {"1": 8, "2": 9, "u": 10}[kind])
+                    is_dirty = True
+                    if fields[1][1] != ".":
+                        changed.append(fields[-1])
+                    if kind == "2":
+                        # A rename is followed by its original path
+                        next(records, None)
+            if unborn or branch == "(detached)":
+                branch = None
             return {
                 "changed": changed,
                 "untracked": untracked,
                 "branch": branch,
-                "is_dirty": self.repo.is_dirty(),
+                "is_dirty": is_dirty,
             }
         except Exception as e:
             raise GitCommandError(f"Failed to get git status: {e}", 1)
 
     def add_files(self, file_paths: List[str]) -> bool:
+        from git import GitCommandError, InvalidGitRepositoryError
+
         if not self.repo:
             raise InvalidGitRepositoryError(f"Not a git repository: {self.repo_path}")
         try:
-            rel_paths = [
-                str(Path(f).resolve().relative_to(self.repo_path)) for f in file_paths
-            ]
+            # Synced files share a handful of directories, so each directory
+            # is resolved once instead of every file walking its full path
+            resolved_dirs: Dict[Path, Path] = {}
+            rel_paths = []
+            for f in file_paths:
+                file_path = Path(f)
+                parent = resolved_dirs.get(file_path.parent)
+                if parent is None:
+                    parent = resolved_dirs[file_path.parent] = file_path.parent.resolve()
+                rel_paths.append(str((parent / file_path.name).relative_to(self.repo_path)))
             self.repo.index.add(rel_paths)
             return True
         except Exception as e:
             raise GitCommandError(f"Failed to add files: {e}", 1)
 
+    def add_all(self, path: Optional[str] = None) -> bool:
+        """
+        Stage every change under a path with a single ``git add -A``.
+
+        Unlike add_files this forks git once however many files changed, and
+        also stages deletions.
+
+        Args:
+            path: Directory or file to stage; defaults to the whole repository
+        """
+        from git import GitCommandError, InvalidGitRepositoryError
+
+        if not self.repo:
+            raise InvalidGitRepositoryError(f"Not a git repository: {self.repo_path}")
+        try:
+            target = Path(path).expanduser().resolve() if path else self.repo_path
+            self.repo.git.add("-A", "--", str(target.relative_to(self.repo_path)))
+            return True
+        except Exception as e:
+            raise GitCommandError(f"Failed to add files: {e}", 1)
+
+    def has_changes(self, path: Optional[str] = None) -> bool:
+        """
+        Check for uncommitted changes, staged or not, under a path.
+
+        Args:
+            path: Directory or file to check; defaults to the whole repository
+        """
+        from git import GitCommandError, InvalidGitRepositoryError
+
+        if not self.repo:
+            raise InvalidGitRepositoryError(f"Not a git repository: {self.repo_path}")
+        try:
+            target = Path(path).expanduser().resolve() if path else self.repo_path
+            return bool(
+                self.repo.git.status(
+                    "--porcelain", "--", str(target.relative_to(self.repo_path))
+                )
+            )
+        except Exception as e:
+            raise GitCommandError(f"Failed to get git status: {e}", 1)
+
     def commit_changes(
         self,
         message: str,
         author_name: Optional[str] = None,
         author_email: Optional[str] = None,
     ) -> bool:
+        from git import Actor, GitCommandError, InvalidGitRepositoryError
+
         if not self.repo:
             raise InvalidGitRepositoryError(f"Not a git repository: {self.repo_path}")
         try:
             author = None
             if author_name and author_email:
-                from git import Actor
-
                 author = Actor(author_name, author_email)
             self.repo.index.commit(message, author=author)
             return True
@@ -123,11 +240,12 @@ class GitManager:
         Returns:
             List of branch names
         """
+        from git import GitCommandError, InvalidGitRepositoryError
+
         if not self.repo:
             raise InvalidGitRepositoryError(f"Not a git repository: {self.repo_path}")
         try:
-            branches = [ref.name for ref in self.repo.references if ref.name.startswith('refs/heads/')]
-            return [branch.replace('refs/heads/', '') for branch in branches]
+            return [head.name for head in self.repo.heads]
         except Exception as e:
             raise GitCommandError(f"Failed to get branches: {e}", 1)
 
@@ -141,6 +259,8 @@ class GitManager:
         Returns:
             True if successful, False otherwise
         """
+        from git import GitCommandError, InvalidGitRepositoryError
+
         if not self.repo:
             raise InvalidGitRepositoryError(f"Not a git repository: {self.repo_path}")
         try:
@@ -160,6 +280,8 @@ class GitManager:
         Returns:
             True if successful, False otherwise
         """
+        from git import GitCommandError, InvalidGitRepositoryError
+
         if not self.repo:
             raise InvalidGitRepositoryError(f"Not a git repository: {self.repo_path}")
         try:
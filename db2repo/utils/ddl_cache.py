@@ -0,0 +1,99 @@
+"""
+On-disk DDL cache for DB2Repo.
+
+This module stores extracted DDL keyed by account, object and the object's
+LAST_ALTERED timestamp, so unchanged objects can skip DDL extraction.
+"""
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+DEFAULT_CACHE_PATH = "~/.db2repo/cache.db"
+
+
+class DDLCache:
+    """SQLite-backed cache of object DDL keyed by LAST_ALTERED."""
+
+    def __init__(self, cache_path: Optional[str] = None, account: str = "") -> None:
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            cache_path: Optional path to the cache file. Defaults to ~/.db2repo/cache.db
+            account: Account the cached objects belong to. The cache file is
+                shared by every profile, so entries are scoped per account.
+        """
+        self.account = account
+        self.cache_path = Path(os.path.expanduser(cache_path or DEFAULT_CACHE_PATH))
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+        with self._db:
+            columns = [
+                row[1] for row in self._db.execute("PRAGMA table_info(ddl_cache)")
+            ]
+            if columns and "account" not in columns:
+                # Entries written before the account was part of the key
+                # cannot be attributed to one; drop them.
+                self._db.execute("DROP TABLE ddl_cache")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS ddl_cache ("
+                " account TEXT, database TEXT, schema TEXT, object_type TEXT,"
+                " name TEXT, last_altered TEXT, ddl TEXT,"
+                " PRIMARY KEY (account, database, schema, object_type, name))"
+            )
+
+    def get(
+        self, database: str, schema: str, object_type: str
+    ) -> Dict[str, Tuple[str, str]]:
+        """
+        Get cached entries for one object type in a schema.
+
+        Returns:
+            Mapping of object name to (last_altered, ddl)
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT name, last_altered, ddl FROM ddl_cache"
+                " WHERE account = ? AND database = ? AND schema = ?"
+                " AND object_type = ?",
+                (self.account, database, schema, object_type),
+            ).fetchall()
+        return {name: (last_altered, ddl) for name, last_altered, ddl in rows}
+
+    def put(
+        self,
+        database: str,
+        schema: str,
+        object_type: str,
+        entries: Iterable[Tuple[str, str, str]],
+    ) -> None:
+        """
+        Store (name, last_altered, ddl) entries for one object type in a schema.
+        """
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO ddl_cache"
+                " (account, database, schema, object_type, name, last_altered,"
+                " ddl) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        self.account,
+                        database,
+                        schema,
+                        object_type,
+                        name,
+                        last_altered,
+                        ddl,
+                    )
+                    for name, last_altered, ddl in entries
+                ),
+            )
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._db.close()
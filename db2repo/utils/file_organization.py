@@ -1,7 +1,7 @@
 import os
 import re
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional
 
 def normalize_name(name: str) -> str:
     """Normalize object names for filesystem (lowercase, replace spaces/special chars)."""
@@ -23,6 +23,38 @@ def get_ddl_file_path(
     obj_name = normalize_name(object_name)
     return Path(base_dir) / db / sch / obj_type / f"{obj_name}{extension}"
 
+def ddl_file_path_builder(
+    base_dir: str, database: str, schema: str, extension: str = ".sql"
+) -> Callable[[str, str], Path]:
+    """
+    Return a get_ddl_file_path equivalent bound to one database and schema.
+
+    The schema directory and each object type directory are built once, so
+    only the object name is normalized per call.
+    """
+    prefix = Path(base_dir) / normalize_name(database) / normalize_name(schema)
+    type_dirs: Dict[str, Path] = {}
+
+    def build(object_type: str, object_name: str) -> Path:
+        type_dir = type_dirs.get(object_type)
+        if type_dir is None:
+            type_dir = type_dirs[object_type] = prefix / normalize_name(object_type)
+        return type_dir / f"{normalize_name(object_name)}{extension}"
+
+    return build
+
+def _write_bytes(file_path: Path, content: bytes, exclusive: bool = False) -> None:
+    """Write content with one os.write, bypassing Python's buffered text I/O."""
+    flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+    flags |= os.O_EXCL if exclusive else os.O_TRUNC
+    fd = os.open(file_path, flags, 0o644)
+    try:
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 def write_ddl_file(
     base_dir: str,
     database: str,
@@ -36,12 +68,24 @@ def write_ddl_file(
     """Write DDL to the appropriate file, creating directories as needed."""
     file_path = get_ddl_file_path(base_dir, database, schema, object_type, object_name, extension)
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    if file_path.exists() and not overwrite:
+    try:
+        _write_bytes(file_path, (ddl.strip() + "\n").encode("utf-8"), exclusive=not overwrite)
+    except FileExistsError:
         raise FileExistsError(f"File already exists: {file_path}")
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(ddl.strip() + "\n")
     return file_path
 
+def write_file_if_changed(file_path: Path, ddl: str) -> bool:
+    """Write DDL to an exact path unless it already holds the same content. Returns whether it was written."""
+    content = (ddl.strip() + "\n").encode("utf-8")
+    try:
+        # Size is checked first so most changed files are caught by a stat
+        if file_path.stat().st_size == len(content) and file_path.read_bytes() == content:
+            return False
+    except FileNotFoundError:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+    _write_bytes(file_path, content)
+    return True
+
 def validate_ddl_file_structure(base_dir: str, database: str, schema: str, object_type: str, object_name: str) -> bool:
     """Validate that the DDL file exists in the expected location."""
     file_path = get_ddl_file_path(base_dir, database, schema, object_type, object_name)
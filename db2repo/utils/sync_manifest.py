@@ -0,0 +1,116 @@
+"""
+Sync manifests for DB2Repo.
+
+This module records which objects the last successful sync of a profile
+extracted, with a hash of each object's DDL, so a dry run can be answered
+without connecting to the database. It also keeps the schema fingerprint
+seen by that sync, so an unchanged schema can be skipped entirely.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+DEFAULT_MANIFEST_DIR = "~/.db2repo/cache"
+
+
+def _manifest_path(profile: str, manifest_dir: Optional[str] = None) -> Path:
+    """Get the manifest file path for a profile."""
+    return Path(os.path.expanduser(manifest_dir or DEFAULT_MANIFEST_DIR)) / (
+        f"{profile}.json"
+    )
+
+
+def ddl_hash(ddl: str) -> str:
+    """Get the SHA-256 hex digest of a DDL string."""
+    return hashlib.sha256(ddl.encode("utf-8")).hexdigest()
+
+
+def save_manifest(
+    profile: str,
+    database: str,
+    schema: str,
+    objects: Iterable[Any],
+    manifest_dir: Optional[str] = None,
+    fingerprint: Optional[str] = None,
+) -> Path:
+    """
+    Record the objects extracted by a sync.
+
+    Args:
+        profile: Profile name the sync ran for
+        database: Database name
+        schema: Schema name
+        objects: DDL records that were written
+        manifest_dir: Optional directory for manifests. Defaults to ~/.db2repo/cache
+        fingerprint: Optional schema fingerprint observed before the sync
+
+    Returns:
+        Path of the written manifest
+    """
+    by_type: Dict[str, List[Dict[str, str]]] = {}
+    for obj in objects:
+        by_type.setdefault(obj.type, []).append(
+            {"name": obj.name, "sha256": ddl_hash(obj.ddl)}
+        )
+    path = _manifest_path(profile, manifest_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "database": database,
+                "schema": schema,
+                "fingerprint": fingerprint,
+                "objects": by_type,
+            },
+            f,
+        )
+    return path
+
+
+def _read_manifest(
+    profile: str, database: str, schema: str, manifest_dir: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """Read a profile's manifest if it was written for this database and schema."""
+    try:
+        with open(_manifest_path(profile, manifest_dir), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict):
+        return None
+    if manifest.get("database") != database or manifest.get("schema") != schema:
+        return None
+    return manifest
+
+
+def load_manifest(
+    profile: str, database: str, schema: str, manifest_dir: Optional[str] = None
+) -> Optional[Dict[str, List[Dict[str, str]]]]:
+    """
+    Load the objects recorded by the last sync of a profile.
+
+    Returns:
+        Mapping of object type to [{"name", "sha256"}] entries, or None if no
+        readable manifest exists for this database and schema
+    """
+    manifest = _read_manifest(profile, database, schema, manifest_dir)
+    objects = manifest.get("objects") if manifest else None
+    return objects if isinstance(objects, dict) else None
+
+
+def load_fingerprint(
+    profile: str, database: str, schema: str, manifest_dir: Optional[str] = None
+) -> Optional[str]:
+    """
+    Load the schema fingerprint recorded by the last sync of a profile.
+
+    Returns:
+        The recorded fingerprint, or None if there is none for this database
+        and schema
+    """
+    manifest = _read_manifest(profile, database, schema, manifest_dir)
+    fingerprint = manifest.get("fingerprint") if manifest else None
+    return fingerprint if isinstance(fingerprint, str) else None
@@ -4,8 +4,14 @@ Validation utilities for DB2Repo.
 This module contains functions for validating configuration and inputs.
 """
 
+import functools
+import re
 from typing import Any, Dict
 
+# Runs of characters Snowflake does not allow unquoted (underscores included,
+# so repeated underscores collapse in the same pass).
+_NON_IDENTIFIER_RUN = re.compile(r"[^a-zA-Z0-9]+")
+
 
 def validate_config(config: Dict[str, Any]) -> bool:
     """Validate configuration structure."""
@@ -18,6 +24,7 @@ def validate_profile(profile_config: Dict[str, Any]) -> bool:
     # This will be implemented in future stories
     return True
 
+@functools.lru_cache(maxsize=256)
 def to_snowflake_name(branch_name: str) -> str:
     """
     Convert a Git branch name to a Snowflake-compliant object name.
@@ -37,17 +44,14 @@ def to_snowflake_name(branch_name: str) -> str:
     if not branch_name:
         return "BRANCH"
     
-    # Replace hyphens and other invalid characters with underscores
-    import re
-    snowflake_name = re.sub(r'[^a-zA-Z0-9_]', '_', branch_name)
+    # Replace hyphens and other invalid characters with underscores,
+    # collapsing consecutive underscores
+    snowflake_name = _NON_IDENTIFIER_RUN.sub('_', branch_name)
     
     # Ensure it starts with a letter or underscore
     if snowflake_name and not snowflake_name[0].isalpha() and snowflake_name[0] != '_':
         snowflake_name = f"branch_{snowflake_name}"
     
-    # Remove consecutive underscores
-    snowflake_name = re.sub(r'_+', '_', snowflake_name)
-    
     # Remove leading/trailing underscores
     snowflake_name = snowflake_name.strip('_')
     
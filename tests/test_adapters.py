@@ -2,11 +2,18 @@
 Tests for AdapterFactory and adapter registration system.
 """
 
+import subprocess
+import sys
+import threading
+import time
+
 import pytest
 from db2repo.adapters import AdapterFactory, DatabaseAdapter
+from db2repo.adapters import snowflake as snowflake_module
 from db2repo.adapters.snowflake import SnowflakeAdapter
 from unittest.mock import patch, MagicMock
 from db2repo.exceptions import DatabaseConnectionError
+from db2repo.utils.ddl_cache import DDLCache
 
 
 class DummyAdapter(DatabaseAdapter):
@@ -59,6 +66,23 @@ def test_factory_register_and_get_dummy_adapter():
     assert adapter.config == config
 
 
+def test_factory_defers_builtin_adapter_import():
+    code = (
+        "import sys; import db2repo.adapters; "
+        "print('db2repo.adapters.snowflake' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
+
+
+def test_snowflake_adapter_importable_from_package():
+    from db2repo.adapters import SnowflakeAdapter as Exported
+
+    assert Exported is SnowflakeAdapter
+
+
 def test_factory_raises_for_unknown_platform():
     config = {"platform": "unknown"}
     with pytest.raises(
@@ -81,6 +105,7 @@ def make_snowflake_config(auth_method="username_password"):
         "database": "db",
         "schema": "public",
         "auth_method": auth_method,
+        "ddl_cache": False,
     }
     if auth_method == "username_password":
         cfg["password"] = "pw"
@@ -112,8 +137,18 @@ def test_connect_external_browser(mock_snowflake):
 
 @patch("db2repo.adapters.snowflake.snowflake")
 def test_connect_ssh_key_reads_file(mock_snowflake, tmp_path):
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
     key_path = tmp_path / "key.pem"
-    key_path.write_bytes(b"PRIVATEKEY")
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.TraditionalOpenSSL,
+            serialization.NoEncryption(),
+        )
+    )
     mock_conn = MagicMock()
     mock_snowflake.connector.connect.return_value = mock_conn
     cfg = make_snowflake_config("ssh_key")
@@ -122,7 +157,14 @@ def test_connect_ssh_key_reads_file(mock_snowflake, tmp_path):
     assert adapter.connect() is True
     assert adapter._connection == mock_conn
     args = mock_snowflake.connector.connect.call_args[1]
-    assert args["private_key"] == b"PRIVATEKEY"
+    assert args["private_key"] == key.private_bytes(
+        serialization.Encoding.DER,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    # The parsed key is reused while the file is unchanged
+    with patch("builtins.open", side_effect=AssertionError("key re-read")):
+        SnowflakeAdapter(cfg)._open_connection()
 
 
 @patch("db2repo.adapters.snowflake.snowflake")
@@ -160,6 +202,64 @@ def test_disconnect_closes_connection(mock_snowflake):
     assert adapter._connection is None
 
 
+@patch("db2repo.adapters.snowflake.snowflake")
+def test_connect_reuses_pooled_connection(mock_snowflake):
+    mock_conn = MagicMock()
+    mock_conn.is_closed.return_value = False
+    mock_snowflake.connector.connect.return_value = mock_conn
+    first = SnowflakeAdapter(make_snowflake_config())
+    first.connect()
+    first.disconnect()
+    mock_conn.close.assert_not_called()
+    second = SnowflakeAdapter(make_snowflake_config())
+    second.connect()
+    assert second._connection is mock_conn
+    assert mock_snowflake.connector.connect.call_count == 1
+    assert mock_snowflake.connector.connect.call_args[1][
+        "client_session_keep_alive"
+    ]
+    second.disconnect()
+    snowflake_module._close_pools()
+    mock_conn.close.assert_called_once()
+    assert not snowflake_module._POOLS
+
+
+@patch("db2repo.adapters.snowflake.snowflake")
+def test_connect_does_not_share_pool_across_credentials(mock_snowflake):
+    mock_snowflake.connector.connect.side_effect = lambda **kwargs: MagicMock()
+    first = SnowflakeAdapter(make_snowflake_config())
+    first.connect()
+    first.disconnect()
+    cfg = make_snowflake_config()
+    cfg["password"] = "other"
+    second = SnowflakeAdapter(cfg)
+    second.connect()
+    assert mock_snowflake.connector.connect.call_count == 2
+    assert mock_snowflake.connector.connect.call_args[1]["password"] == "other"
+    second.disconnect()
+    snowflake_module._close_pools()
+
+
+@patch("db2repo.adapters.snowflake.snowflake")
+def test_concurrent_connect_opens_one_session(mock_snowflake):
+    def slow_connect(**kwargs):
+        time.sleep(0.05)
+        return MagicMock()
+
+    mock_snowflake.connector.connect.side_effect = slow_connect
+    cfg = make_snowflake_config()
+    cfg["account"] = "concurrent"
+    adapter = SnowflakeAdapter(cfg)
+    threads = [threading.Thread(target=adapter.connect) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert mock_snowflake.connector.connect.call_count == 1
+    adapter.disconnect()
+    snowflake_module._close_pools()
+
+
 @patch("db2repo.adapters.snowflake.snowflake")
 def test_test_connection_success(mock_snowflake):
     mock_conn = MagicMock()
@@ -184,52 +284,279 @@ def test_test_connection_failure(mock_snowflake):
         adapter.test_connection()
 
 
+def respond_by_sql(mock_conn, respond):
+    """
+    Give every cursor() call its own mock returning respond(sql, params) as its rows.
+
+    DDL batches may fall back to per-object queries on worker threads, so
+    results are matched to statements rather than to call order. Returns the
+    list of executed (sql, params) pairs.
+    """
+    executed = []
+
+    def make_cursor():
+        cursor = MagicMock()
+        cursor.fetch_arrow_batches.side_effect = Exception("pyarrow not installed")
+        cursor.description = STAGE_DESCRIPTION
+
+        def execute(sql, params=()):
+            executed.append((sql, params))
+            rows = respond(sql, params)
+            cursor.fetchall.return_value = rows
+            cursor.fetchone.return_value = rows[0] if rows else None
+            cursor.fetchmany.side_effect = [rows, []]
+
+        cursor.execute.side_effect = execute
+        return cursor
+
+    mock_conn.cursor.side_effect = make_cursor
+    return executed
+
+
+def ddl_batch_rows(params):
+    """Answer a GET_DDL batch with "CREATE <type> <fqn>" for every object."""
+    return [
+        (params[i], params[i + 1], f"CREATE {params[i + 2]} {params[i + 3]}")
+        for i in range(0, len(params), 4)
+    ]
+
+
+TABLE_LISTING = [
+    ("T1", '"DB"."SCHEMA"."T1"', "2023-01-01", None),
+    ("T2", '"DB"."SCHEMA"."T2"', "2023-01-01", None),
+]
+
+
 @patch("db2repo.adapters.snowflake.snowflake")
-def test_get_tables_and_error_handling(mock_snowflake):
+def test_get_tables_batches_constant_get_ddl_calls(mock_snowflake):
     adapter = SnowflakeAdapter(make_snowflake_config())
     mock_conn = MagicMock()
-    mock_cursor = MagicMock()
     adapter._connection = mock_conn
-    mock_conn.cursor.return_value = mock_cursor
-    # Simulate two tables, one with DDL, one with error
-    mock_cursor.description = [("NAME",), ("CREATED_ON",)]
-    mock_cursor.fetchall.return_value = [("T1", "2023-01-01"), ("T2", "2023-01-01")]
-    # First table returns DDL, second raises error
-    def execute_side_effect(sql):
-        if sql.startswith("SELECT GET_DDL") and "T2" in sql:
-            raise Exception("DDL error")
-        # Do not change description here
 
-    mock_cursor.execute.side_effect = execute_side_effect
-    mock_cursor.fetchone.side_effect = [("CREATE TABLE T1 ...",)]
+    def respond(sql, params):
+        if "LAST_ALTERED" in sql:
+            return TABLE_LISTING
+        # NULL DDL is passed through
+        return [("TABLE", "T1", "CREATE TABLE T1 ..."), ("TABLE", "T2", None)]
+
+    executed = respond_by_sql(mock_conn, respond)
     results = adapter.get_tables("DB", "SCHEMA")
+    assert len(executed) == 2
+    list_sql, list_params = executed[0]
+    assert "GET_DDL" not in list_sql
+    assert "TABLE_TYPE = 'BASE TABLE'" in list_sql
+    assert list_params == ("DB.INFORMATION_SCHEMA.TABLES", "SCHEMA")
+    # GET_DDL only ever receives bound constants, never a column expression
+    sql, params = executed[1]
+    assert sql == (
+        "SELECT %s, %s, GET_DDL(%s, %s) UNION ALL SELECT %s, %s, GET_DDL(%s, %s)"
+    )
+    assert params == (
+        "TABLE",
+        "T1",
+        "TABLE",
+        '"DB"."SCHEMA"."T1"',
+        "TABLE",
+        "T2",
+        "TABLE",
+        '"DB"."SCHEMA"."T2"',
+    )
     assert len(results) == 2
-    assert results[0]["name"] == "T1"
-    assert results[0]["ddl"] == "CREATE TABLE T1 ..."
-    assert results[1]["name"] == "T2"
-    assert results[1]["ddl"] is None
-    assert "error" in results[1]
+    assert results[0].name == "T1"
+    assert results[0].ddl == "CREATE TABLE T1 ..."
+    assert results[1].name == "T2"
+    assert results[1].ddl is None
 
 
+@patch("db2repo.adapters.snowflake._DDL_BATCH_SIZE", 1)
 @patch("db2repo.adapters.snowflake.snowflake")
-def test_get_views_and_materialized_views(mock_snowflake):
+def test_iter_tables_streams_batches(mock_snowflake):
+    adapter = SnowflakeAdapter(make_snowflake_config())
+    mock_conn = MagicMock()
+    adapter._connection = mock_conn
+    executed = respond_by_sql(
+        mock_conn,
+        lambda sql, params: (
+            TABLE_LISTING if "LAST_ALTERED" in sql else ddl_batch_rows(params)
+        ),
+    )
+    records = adapter.iter_tables("DB", "SCHEMA")
+    assert next(records).name == "T1"
+    assert len(executed) == 2
+    assert [r.name for r in records] == ["T2"]
+    assert len(executed) == 3
+
+
+@patch("db2repo.adapters.snowflake.snowflake")
+def test_get_tables_falls_back_to_per_object_ddl(mock_snowflake):
+    adapter = SnowflakeAdapter(make_snowflake_config())
+    mock_conn = MagicMock()
+    adapter._connection = mock_conn
+
+    def respond(sql, params):
+        if "LAST_ALTERED" in sql:
+            return TABLE_LISTING
+        if "UNION ALL" in sql or params[1] == '"DB"."SCHEMA"."T2"':
+            raise Exception("DDL error")
+        assert sql == "SELECT GET_DDL(%s, %s)"
+        return [(f"CREATE TABLE {params[1]} ...",)]
+
+    executed = respond_by_sql(mock_conn, respond)
+    results = adapter.get_tables("DB", "SCHEMA")
+    assert len(executed) == 4
+    assert [r.name for r in results] == ["T1", "T2"]
+    assert results[0].ddl == 'CREATE TABLE "DB"."SCHEMA"."T1" ...'
+    assert results[1].ddl is None
+    assert results[1].error == "DDL error"
+
+
+@patch("db2repo.adapters.snowflake.ThreadPoolExecutor")
+def test_map_objects_honours_max_parallel_ddl(mock_executor):
+    cfg = make_snowflake_config()
+    cfg["max_parallel_ddl"] = 2
+    adapter = SnowflakeAdapter(cfg)
+    mock_executor.return_value.__enter__.return_value.map.side_effect = map
+    assert adapter._map_objects(str.upper, ["a", "b", "c"]) == ["A", "B", "C"]
+    mock_executor.assert_called_once_with(max_workers=2)
+
+
+@patch("db2repo.adapters.snowflake.snowflake")
+def test_get_tables_only_fetches_changed_ddl(mock_snowflake, tmp_path):
+    cfg = make_snowflake_config()
+    cfg["ddl_cache"] = True
+    cfg["ddl_cache_path"] = str(tmp_path / "cache.db")
+    adapter = SnowflakeAdapter(cfg)
+    mock_conn = MagicMock()
+    adapter._connection = mock_conn
+    listing = TABLE_LISTING
+    executed = respond_by_sql(
+        mock_conn,
+        lambda sql, params: (
+            listing if "LAST_ALTERED" in sql else ddl_batch_rows(params)
+        ),
+    )
+    # First run: probe, then GET_DDL for both objects
+    results = adapter.get_tables("DB", "SCHEMA")
+    assert [r.ddl for r in results] == [
+        'CREATE TABLE "DB"."SCHEMA"."T1"',
+        'CREATE TABLE "DB"."SCHEMA"."T2"',
+    ]
+    # Second run (new session): only T2 was altered, so only T2 is fetched
+    adapter.disconnect()
+    adapter._connection = mock_conn
+    listing = [listing[0], ("T2", '"DB"."SCHEMA"."T2"', "2023-02-01", None)]
+    executed.clear()
+    results = adapter.get_tables("DB", "SCHEMA")
+    assert [r.name for r in results] == ["T1", "T2"]
+    assert len(executed) == 2
+    assert executed[1] == (
+        "SELECT %s, %s, GET_DDL(%s, %s)",
+        ("TABLE", "T2", "TABLE", '"DB"."SCHEMA"."T2"'),
+    )
+    adapter.disconnect()
+
+
+@patch("db2repo.adapters.snowflake.snowflake")
+def test_list_objects_reused_until_disconnect(mock_snowflake):
     adapter = SnowflakeAdapter(make_snowflake_config())
     mock_conn = MagicMock()
     mock_cursor = MagicMock()
     adapter._connection = mock_conn
     mock_conn.cursor.return_value = mock_cursor
-    mock_cursor.description = [("name",), ("created_on",)]
-    mock_cursor.fetchall.return_value = [("V1", "2023-01-01")]
-    mock_cursor.execute.side_effect = None
-    mock_cursor.fetchone.side_effect = [("2023-01-01", "V1", "CREATE VIEW V1 ...")]
+    mock_cursor.fetch_arrow_batches.side_effect = Exception("pyarrow not installed")
+    mock_cursor.fetchall.return_value = TABLE_LISTING
+    first = adapter._list_objects("DB", "SCHEMA", "TABLE")
+    assert adapter._list_objects("DB", "SCHEMA", "TABLE") is first
+    assert mock_cursor.execute.call_count == 1
+    adapter._list_objects("DB", "SCHEMA", "VIEW")
+    assert mock_cursor.execute.call_count == 2
+    adapter.disconnect()
+    adapter._connection = mock_conn
+    adapter._list_objects("DB", "SCHEMA", "TABLE")
+    assert mock_cursor.execute.call_count == 3
+
+
+def test_fetch_rows_columnar_reads_arrow_batches():
+    def column(values):
+        col = MagicMock()
+        col.to_pylist.return_value = values
+        return col
+
+    batch1 = MagicMock(columns=[column(["T1", "T2"]), column([1, 2])])
+    batch2 = MagicMock(columns=[column(["T3"]), column([3])])
+    cursor = MagicMock()
+    cursor.fetch_arrow_batches.return_value = iter([batch1, batch2])
+    rows = snowflake_module._fetch_rows_columnar(cursor)
+    assert rows == [("T1", 1), ("T2", 2), ("T3", 3)]
+    cursor.fetchall.assert_not_called()
+
+
+@patch("db2repo.adapters.snowflake.snowflake")
+def test_get_views_and_materialized_views(mock_snowflake):
+    adapter = SnowflakeAdapter(make_snowflake_config())
+    mock_conn = MagicMock()
+    adapter._connection = mock_conn
+
+    def respond(sql, params):
+        if "VIEW_DEFINITION" in sql:
+            # V2 is a secure view whose definition the role cannot see
+            return [
+                ("V1", '"DB"."SCHEMA"."V1"', "2023-01-01", "CREATE VIEW V1 ..."),
+                ("V2", '"DB"."SCHEMA"."V2"', "2023-01-01", None),
+            ]
+        if "LAST_ALTERED" in sql:
+            return [("MV1", '"DB"."SCHEMA"."MV1"', "2023-01-01", None)]
+        return ddl_batch_rows(params)
+
+    executed = respond_by_sql(mock_conn, respond)
     # Test get_views
     results = adapter.get_views("DB", "SCHEMA")
-    assert len(results) == 1
-    assert results[0]["type"] == "VIEW"
+    assert [r.type for r in results] == ["VIEW", "VIEW"]
+    assert [r.ddl for r in results] == [
+        "CREATE VIEW V1 ...",
+        'CREATE VIEW "DB"."SCHEMA"."V2"',
+    ]
+    assert executed[0][1] == ("DB.INFORMATION_SCHEMA.VIEWS", "SCHEMA")
+    assert executed[1] == (
+        "SELECT %s, %s, GET_DDL(%s, %s)",
+        ("VIEW", "V2", "VIEW", '"DB"."SCHEMA"."V2"'),
+    )
     # Test get_materialized_views
     results = adapter.get_materialized_views("DB", "SCHEMA")
     assert len(results) == 1
-    assert results[0]["type"] == "MATERIALIZED_VIEW"
+    assert results[0].type == "MATERIALIZED_VIEW"
+    assert results[0].ddl == 'CREATE VIEW "DB"."SCHEMA"."MV1"'
+    assert "TABLE_TYPE = 'MATERIALIZED VIEW'" in executed[2][0]
+    assert "VIEW_DEFINITION" not in executed[2][0]
+
+
+STAGE_DESCRIPTION = [
+    ("name",),
+    ("url",),
+    ("type",),
+    ("storage_integration",),
+    ("comment",),
+]
+
+
+@patch("db2repo.adapters.snowflake.snowflake")
+def test_get_stages_handles_malformed_row(mock_snowflake):
+    adapter = SnowflakeAdapter(make_snowflake_config())
+    mock_conn = MagicMock()
+    mock_cursor = MagicMock()
+    adapter._connection = mock_conn
+    mock_conn.cursor.return_value = mock_cursor
+    mock_cursor.description = STAGE_DESCRIPTION
+    # S1 has a non-string URL; S2 is still exported
+    mock_cursor.fetchmany.side_effect = [
+        [("S1", 42, "EXTERNAL", None, None), ("S2", None, "INTERNAL", None, None)],
+        [],
+    ]
+    results = adapter.get_stages("DB", "SCHEMA")
+    assert [r.name for r in results] == ["S1", "S2"]
+    assert results[0].ddl is None
+    assert results[0].error
+    assert results[1].ddl == "CREATE OR REPLACE STAGE SCHEMA.S2;"
 
 
 @patch("db2repo.adapters.snowflake.snowflake")
@@ -239,18 +566,203 @@ def test_get_stages_and_pipes(mock_snowflake):
     mock_cursor = MagicMock()
     adapter._connection = mock_conn
     mock_conn.cursor.return_value = mock_cursor
-    mock_cursor.description = [("name",), ("created_on",)]
-    mock_cursor.fetchall.return_value = [("S1", "2023-01-01")]
-    mock_cursor.execute.side_effect = None
-    mock_cursor.fetchone.side_effect = [("2023-01-01", "S1", "CREATE STAGE S1 ...")]
+    mock_cursor.description = STAGE_DESCRIPTION
+    mock_cursor.fetchmany.side_effect = [
+        [
+            ("S1", "s3://bucket/path", "EXTERNAL", "S3_INT", None),
+            ("S2", "", "INTERNAL NO CSE", None, "it's internal"),
+        ],
+        [],
+    ]
     # Test get_stages
     results = adapter.get_stages("DB", "SCHEMA")
-    assert len(results) == 1
-    assert results[0]["type"] == "STAGE"
+    mock_cursor.execute.assert_called_once_with("SHOW STAGES IN SCHEMA DB.SCHEMA")
+    assert [r.type for r in results] == ["STAGE", "STAGE"]
+    assert results[0].ddl == (
+        "CREATE OR REPLACE STAGE SCHEMA.S1\n"
+        "  URL = 's3://bucket/path'\n"
+        "  STORAGE_INTEGRATION = S3_INT;"
+    )
+    assert results[1].ddl == (
+        "CREATE OR REPLACE STAGE SCHEMA.S2\n"
+        "  ENCRYPTION = (TYPE = 'SNOWFLAKE_SSE')\n"
+        "  COMMENT = 'it\\'s internal';"
+    )
     # Test get_snowpipes
+    executed = respond_by_sql(
+        mock_conn,
+        lambda sql, params: (
+            [("P1", '"DB"."SCHEMA"."P1"', "2023-01-01", None)]
+            if "LAST_ALTERED" in sql
+            else ddl_batch_rows(params)
+        ),
+    )
     results = adapter.get_snowpipes("DB", "SCHEMA")
     assert len(results) == 1
-    assert results[0]["type"] == "PIPE"
+    assert results[0].type == "PIPE"
+    assert results[0].ddl == 'CREATE PIPE "DB"."SCHEMA"."P1"'
+    assert executed[0][1] == ("DB.INFORMATION_SCHEMA.PIPES", "SCHEMA")
+
+
+ALL_OBJECTS_LISTING = [
+    ("TABLE", "T1", '"DB"."SCHEMA"."T1"', "2023-01-01", None),
+    ("PIPE", "P1", '"DB"."SCHEMA"."P1"', "2023-01-01", None),
+]
+
+
+def respond_to_all_objects(sql, params):
+    if sql.startswith("SHOW STAGES"):
+        return [("S1", "s3://bucket/path", "EXTERNAL", None, None)]
+    if "PROCEDURE_NAME" in sql:
+        return [("PR1", "()", "SQL", "BEGIN RETURN 1; END;", "INT")]
+    if "LAST_ALTERED" in sql:
+        return ALL_OBJECTS_LISTING
+    return ddl_batch_rows(params)
+
+
+@patch("db2repo.adapters.snowflake.snowflake")
+def test_get_all_objects_single_listing(mock_snowflake):
+    adapter = SnowflakeAdapter(make_snowflake_config())
+    mock_conn = MagicMock()
+    adapter._connection = mock_conn
+    executed = respond_by_sql(mock_conn, respond_to_all_objects)
+    objects = adapter.get_all_objects("DB", "SCHEMA")
+    # listing, one GET_DDL batch, stages and procedures
+    assert len(executed) == 4
+    [(sql, params)] = [call for call in executed if "LAST_ALTERED" in call[0]]
+    assert sql.count("UNION ALL") == 3
+    assert params[:2] == ("DB.INFORMATION_SCHEMA.TABLES", "SCHEMA")
+    assert params[-2:] == ("DB.INFORMATION_SCHEMA.PIPES", "SCHEMA")
+    [(sql, params)] = [call for call in executed if "GET_DDL(%s" in call[0]]
+    assert params == (
+        "TABLE",
+        "T1",
+        "TABLE",
+        '"DB"."SCHEMA"."T1"',
+        "PIPE",
+        "P1",
+        "PIPE",
+        '"DB"."SCHEMA"."P1"',
+    )
+    assert {t: [r.name for r in records] for t, records in objects.items()} == {
+        "TABLE": ["T1"],
+        "VIEW": [],
+        "MATERIALIZED_VIEW": [],
+        "PIPE": ["P1"],
+        "PROCEDURE": ["PR1"],
+        "STAGE": ["S1"],
+    }
+    assert objects["PIPE"][0].ddl == 'CREATE PIPE "DB"."SCHEMA"."P1"'
+
+
+@patch("db2repo.adapters.snowflake.snowflake")
+def test_get_all_objects_falls_back_per_object(mock_snowflake):
+    adapter = SnowflakeAdapter(make_snowflake_config())
+    mock_conn = MagicMock()
+    adapter._connection = mock_conn
+
+    def respond(sql, params):
+        if "UNION ALL" in sql and "GET_DDL" in sql:
+            raise Exception("GET_DDL failed")
+        if sql == "SELECT GET_DDL(%s, %s)":
+            return [(f"CREATE {params[0]} {params[1]}",)]
+        return respond_to_all_objects(sql, params)
+
+    executed = respond_by_sql(mock_conn, respond)
+    objects = adapter.get_all_objects("DB", "SCHEMA")
+    # The stage and procedure queries are not run a second time
+    assert sum(sql.startswith("SHOW STAGES") for sql, _ in executed) == 1
+    assert sum("PROCEDURE_NAME" in sql for sql, _ in executed) == 1
+    assert [r.ddl for r in objects["TABLE"]] == ['CREATE TABLE "DB"."SCHEMA"."T1"']
+    assert [r.name for r in objects["STAGE"]] == ["S1"]
+
+
+@patch("db2repo.adapters.snowflake.snowflake")
+def test_get_all_objects_checks_ddl_cache_by_default(mock_snowflake, tmp_path):
+    cfg = make_snowflake_config()
+    del cfg["ddl_cache"]
+    cfg["ddl_cache_path"] = str(tmp_path / "cache.db")
+    adapter = SnowflakeAdapter(cfg)
+    mock_conn = MagicMock()
+    adapter._connection = mock_conn
+
+    # First run: one listing, one GET_DDL batch, stages and procedures
+    executed = respond_by_sql(mock_conn, respond_to_all_objects)
+    objects = adapter.get_all_objects("DB", "SCHEMA")
+    assert len(executed) == 4
+    assert [r.ddl for r in objects["TABLE"]] == ['CREATE TABLE "DB"."SCHEMA"."T1"']
+    # Second run (new session): nothing changed, so GET_DDL is not evaluated
+    adapter.disconnect()
+    adapter._connection = mock_conn
+    executed.clear()
+    objects = adapter.get_all_objects("DB", "SCHEMA")
+    assert len(executed) == 3
+    assert not [call for call in executed if "GET_DDL(%s" in call[0]]
+    assert {t: [r.ddl for r in records] for t, records in objects.items()} == {
+        "TABLE": ['CREATE TABLE "DB"."SCHEMA"."T1"'],
+        "VIEW": [],
+        "MATERIALIZED_VIEW": [],
+        "PIPE": ['CREATE PIPE "DB"."SCHEMA"."P1"'],
+        "PROCEDURE": [
+            "CREATE OR REPLACE PROCEDURE SCHEMA.PR1 ()\nRETURNS INT\nLANGUAGE SQL\n"
+            "AS\nBEGIN RETURN 1; END;"
+        ],
+        "STAGE": ["CREATE OR REPLACE STAGE SCHEMA.S1\n  URL = 's3://bucket/path';"],
+    }
+    adapter.disconnect()
+
+
+def test_ddl_cache_entries_are_scoped_per_account(tmp_path):
+    path = str(tmp_path / "cache.db")
+    first = DDLCache(path, "acct1")
+    first.put("DB", "S", "TABLE", [("T1", "2023-01-01", "CREATE TABLE T1 ...")])
+    first.close()
+    second = DDLCache(path, "acct2")
+    assert second.get("DB", "S", "TABLE") == {}
+    second.close()
+    first = DDLCache(path, "acct1")
+    assert first.get("DB", "S", "TABLE") == {
+        "T1": ("2023-01-01", "CREATE TABLE T1 ...")
+    }
+    first.close()
+
+
+@patch("db2repo.adapters.snowflake.snowflake")
+def test_get_schema_fingerprint(mock_snowflake):
+    adapter = SnowflakeAdapter(make_snowflake_config())
+    mock_conn = MagicMock()
+    mock_cursor = MagicMock()
+    adapter._connection = mock_conn
+    mock_conn.cursor.return_value = mock_cursor
+    mock_cursor.fetchone.return_value = (3, "2024-01-01 00:00:00")
+    assert adapter.get_schema_fingerprint("DB", "SCHEMA") == "3:2024-01-01 00:00:00"
+    sql, params = mock_cursor.execute.call_args[0]
+    assert "MAX(LAST_ALTERED)" in sql
+    assert params[:2] == ("DB.INFORMATION_SCHEMA.TABLES", "SCHEMA")
+    mock_cursor.execute.side_effect = Exception("no access")
+    assert adapter.get_schema_fingerprint("DB", "SCHEMA") is None
+
+
+@patch("db2repo.adapters.snowflake.snowflake")
+def test_get_all_objects_skips_schema_with_empty_fingerprint(mock_snowflake):
+    adapter = SnowflakeAdapter(make_snowflake_config())
+    mock_conn = MagicMock()
+    mock_cursor = MagicMock()
+    adapter._connection = mock_conn
+    mock_conn.cursor.return_value = mock_cursor
+    mock_cursor.fetchone.return_value = (0, None)
+    assert adapter.get_schema_fingerprint("DB", "SCHEMA") == "0:None"
+    objects = adapter.get_all_objects("DB", "SCHEMA")
+    assert mock_cursor.execute.call_count == 1
+    assert all(records == [] for records in objects.values())
+    assert set(objects) == {
+        "TABLE",
+        "VIEW",
+        "MATERIALIZED_VIEW",
+        "PIPE",
+        "PROCEDURE",
+        "STAGE",
+    }
 
 
 @patch("db2repo.adapters.snowflake.snowflake")
@@ -274,20 +786,20 @@ def test_get_stored_procedures_sql(mock_snowflake):
     mock_cursor = MagicMock()
     adapter._connection = mock_conn
     mock_conn.cursor.return_value = mock_cursor
-    mock_cursor.description = [
-        ("PROCEDURE_NAME",),
-        ("ARGUMENT_SIGNATURE",),
-        ("PROCEDURE_LANGUAGE",),
-        ("PROCEDURE_DEFINITION",),
-        ("DATA_TYPE",),
-    ]
-    mock_cursor.fetchall.return_value = [
-        ("MYPROC", "(a INT)", "SQL", "BEGIN RETURN a+1; END;", "INT")
+    mock_cursor.fetchmany.side_effect = [
+        [("MYPROC", "(a INT)", "SQL", "BEGIN RETURN a+1; END;", "INT")],
+        [],
     ]
     results = adapter.get_stored_procedures("DB", "SCHEMA")
+    mock_cursor.execute.assert_called_once()
+    sql, params = mock_cursor.execute.call_args[0]
+    assert "GET_DDL" not in sql
+    assert params == ("DB.INFORMATION_SCHEMA.PROCEDURES", "SCHEMA", "%")
     assert len(results) == 1
-    ddl = results[0]["ddl"]
-    assert "CREATE OR REPLACE PROCEDURE DB.SCHEMA.MYPROC (a INT)" in ddl
+    assert results[0].type == "PROCEDURE"
+    assert results[0].language == "SQL"
+    ddl = results[0].ddl
+    assert "CREATE OR REPLACE PROCEDURE SCHEMA.MYPROC (a INT)" in ddl
     assert "RETURNS INT" in ddl
     assert "LANGUAGE SQL" in ddl
     assert "BEGIN RETURN a+1; END;" in ddl
@@ -301,23 +813,19 @@ def test_get_stored_procedures_js_and_python(mock_snowflake):
     mock_cursor = MagicMock()
     adapter._connection = mock_conn
     mock_conn.cursor.return_value = mock_cursor
-    mock_cursor.description = [
-        ("PROCEDURE_NAME",),
-        ("ARGUMENT_SIGNATURE",),
-        ("PROCEDURE_LANGUAGE",),
-        ("PROCEDURE_DEFINITION",),
-        ("DATA_TYPE",),
-    ]
-    mock_cursor.fetchall.return_value = [
-        ("MYJS", "(x INT)", "JAVASCRIPT", "return x+1;", "INT"),
-        ("MYPY", "(y INT)", "PYTHON", "return y+1", "INT"),
+    mock_cursor.fetchmany.side_effect = [
+        [
+            ("MYJS", "(x INT)", "JAVASCRIPT", "return x+1;", "INT"),
+            ("MYPY", "(y INT)", "PYTHON", "return y+1", "INT"),
+        ],
+        [],
     ]
     results = adapter.get_stored_procedures("DB", "SCHEMA")
     assert len(results) == 2
-    assert results[0]["language"].upper() == "JAVASCRIPT"
-    assert "$$" in results[0]["ddl"]
-    assert results[1]["language"].upper() == "PYTHON"
-    assert "$$" in results[1]["ddl"]
+    assert results[0].language == "JAVASCRIPT"
+    assert "$$\nreturn x+1;\n$$" in results[0].ddl
+    assert results[1].language == "PYTHON"
+    assert "$$\nreturn y+1\n$$" in results[1].ddl
 
 
 @patch("db2repo.adapters.snowflake.snowflake")
@@ -327,21 +835,35 @@ def test_get_stored_procedures_error_handling(mock_snowflake):
     mock_cursor = MagicMock()
     adapter._connection = mock_conn
     mock_conn.cursor.return_value = mock_cursor
-    mock_cursor.description = [
-        ("PROCEDURE_NAME",),
-        ("ARGUMENT_SIGNATURE",),
-        ("PROCEDURE_LANGUAGE",),
-        ("PROCEDURE_DEFINITION",),
-        ("DATA_TYPE",),
-    ]
-    # Malformed tuple (missing DATA_TYPE)
-    mock_cursor.fetchall.return_value = [
-        ("BADPROC", "(z INT)", "SQL", "BEGIN RETURN z; END;")
+    # Malformed tuple (missing DATA_TYPE) next to a well-formed one
+    mock_cursor.fetchmany.side_effect = [
+        [
+            ("BADPROC", "(z INT)", "SQL", "BEGIN RETURN z; END;"),
+            ("GOODPROC", "()", "SQL", "BEGIN RETURN 1; END;", "INT"),
+        ],
+        [],
     ]
     results = adapter.get_stored_procedures("DB", "SCHEMA")
-    assert len(results) == 1
-    assert results[0]["ddl"] is None
-    assert "error" in results[0]
+    assert [r.name for r in results] == ["BADPROC", "GOODPROC"]
+    assert results[0].ddl is None
+    assert results[0].error
+    assert results[0].language == "SQL"
+    assert results[1].ddl is not None
+    assert results[1].error is None
+
+
+@patch("db2repo.adapters.snowflake.snowflake")
+def test_get_stored_procedures_name_filter(mock_snowflake):
+    adapter = SnowflakeAdapter(make_snowflake_config())
+    mock_conn = MagicMock()
+    mock_cursor = MagicMock()
+    adapter._connection = mock_conn
+    mock_conn.cursor.return_value = mock_cursor
+    mock_cursor.fetchmany.return_value = []
+    adapter.get_stored_procedures("DB", "SCHEMA", name_pattern="LOAD_%")
+    sql, params = mock_cursor.execute.call_args[0]
+    assert "PROCEDURE_NAME ILIKE %s" in sql
+    assert params[-1] == "LOAD_%"
 
 
 @patch("db2repo.adapters.snowflake.snowflake")
@@ -356,4 +878,16 @@ def test_get_stored_procedures_query_error(mock_snowflake):
         DatabaseConnectionError, match="Failed to fetch procedures: query error"
     ):
         adapter.get_stored_procedures("DB", "SCHEMA")
- 
\ No newline at end of file
+ 
+
+@patch("db2repo.adapters.snowflake.snowflake")
+def test_clone_database_binds_identifiers(mock_snowflake):
+    adapter = SnowflakeAdapter(make_snowflake_config())
+    mock_conn = MagicMock()
+    mock_cursor = MagicMock()
+    adapter._connection = mock_conn
+    mock_conn.cursor.return_value = mock_cursor
+    assert adapter.clone_database("DB", "DB_FEATURE") is True
+    mock_cursor.execute.assert_called_once_with(
+        "CREATE DATABASE IDENTIFIER(%s) CLONE IDENTIFIER(%s)", ("DB_FEATURE", "DB")
+    )
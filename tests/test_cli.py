@@ -2,9 +2,14 @@
 Tests for CLI module.
 """
 
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
+
 import pytest
 from click.testing import CliRunner
 
+from db2repo.adapters import DDLRecord
 from db2repo.cli import cli
 
 
@@ -27,8 +32,403 @@ class TestCLI:
         assert result.exit_code == 0
         assert "version" in result.output.lower()
 
+    def test_version_does_not_import_rich(self):
+        """Test that the version command runs without loading rich."""
+        code = (
+            "import sys; from click.testing import CliRunner; "
+            "from db2repo.cli import cli; CliRunner().invoke(cli, ['version']); "
+            "print('rich' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "False"
+
+    def test_main_version_does_not_import_click(self):
+        """Test that the entry point answers --version without loading click."""
+        for arg in ("--version", "version"):
+            code = (
+                f"import sys; sys.argv = ['db2repo', '{arg}']; import db2repo; "
+                "db2repo.main(); print('click' in sys.modules)"
+            )
+            out = subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, text=True, check=True
+            )
+            assert out.stdout.splitlines() == [
+                "db2repo, version 0.1.0" if arg == "--version" else "DB2Repo version 0.1.0",
+                "False",
+            ]
+
+    def test_import_does_not_load_gitpython(self):
+        """Test that importing the CLI leaves GitPython unloaded until needed."""
+        code = "import sys, db2repo.cli; print('git' in sys.modules)"
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "False"
+
     def test_help_command(self):
         """Test help command."""
         result = self.runner.invoke(cli, ["help"])
         assert result.exit_code == 0
         assert "DB2Repo" in result.output
+
+
+class TestSyncCommand:
+    """Test cases for the sync command."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.runner = CliRunner()
+
+    @patch("db2repo.cli.save_manifest")
+    @patch("db2repo.cli.write_file_if_changed")
+    @patch("db2repo.cli.GitManager")
+    @patch("db2repo.cli.AdapterFactory")
+    @patch("db2repo.cli.ConfigManager")
+    def test_sync_fetches_all_object_types_at_once(
+        self,
+        mock_config_manager,
+        mock_factory,
+        mock_git_manager,
+        mock_write,
+        mock_save_manifest,
+    ):
+        """Test that sync extracts every object type with one adapter call."""
+        profile = {
+            "platform": "snowflake",
+            "database": "DB",
+            "schema": "PUBLIC",
+            "git_repo_path": "/repo",
+            "git_author_name": "Sync Bot",
+            "git_author_email": "bot@example.com",
+        }
+        mock_config = MagicMock()
+        mock_config.profile_exists.return_value = True
+        mock_config.get_profile.return_value = profile
+        mock_config_manager.return_value = mock_config
+        mock_git_manager.return_value.get_current_branch.return_value = "main"
+        adapter = mock_factory.get_adapter.return_value
+        adapter.get_all_objects.return_value = {
+            "TABLE": [DDLRecord("T1", "TABLE", "DB", "PUBLIC", "CREATE TABLE T1")],
+            "VIEW": [],
+            "MATERIALIZED_VIEW": [],
+            "STAGE": [],
+            "PIPE": [],
+            "PROCEDURE": [],
+        }
+        mock_write.return_value = True
+
+        result = self.runner.invoke(cli, ["sync", "--profile", "dev"])
+
+        assert result.exit_code == 0, result.output
+        adapter.get_all_objects.assert_called_once_with("DB", "PUBLIC")
+        adapter.get_tables.assert_not_called()
+        mock_write.assert_called_once()
+        assert "Successful: 1" in result.output
+        mock_save_manifest.assert_called_once()
+
+        result = self.runner.invoke(cli, ["sync", "--profile", "dev", "--commit"])
+
+        assert result.exit_code == 0, result.output
+        git_manager = mock_git_manager.return_value
+        git_manager.add_all.assert_called_once_with("/repo/db")
+        git_manager.commit_changes.assert_called_once_with(
+            "Sync DDL from DB.PUBLIC - 1 objects",
+            author_name="Sync Bot",
+            author_email="bot@example.com",
+        )
+        git_manager.add_files.assert_not_called()
+
+        mock_write.reset_mock()
+        result = self.runner.invoke(cli, ["sync", "--profile", "dev", "--dry-run"])
+
+        assert result.exit_code == 0, result.output
+        mock_write.assert_not_called()
+        assert "Successful: 1" in result.output
+
+    @patch("db2repo.cli.GitManager")
+    @patch("db2repo.cli.AdapterFactory")
+    @patch("db2repo.cli.ConfigManager")
+    def test_sync_uses_active_profile(
+        self, mock_config_manager, mock_factory, mock_git_manager
+    ):
+        """Test that sync without --profile runs against the active profile."""
+        mock_config = MagicMock()
+        mock_config.get_active_profile.return_value = "dev"
+        mock_config.get_active_profile_config.return_value = {
+            "platform": "snowflake",
+            "database": "DB",
+            "schema": "PUBLIC",
+            "git_repo_path": "/repo",
+        }
+        mock_config.get_profile.return_value = None
+        mock_config_manager.return_value = mock_config
+        mock_git_manager.return_value.get_current_branch.return_value = "feature/x"
+        adapter = mock_factory.get_adapter.return_value
+        adapter.get_schema_fingerprint.return_value = None
+        adapter.get_all_objects.return_value = {}
+
+        result = self.runner.invoke(cli, ["sync", "--dry-run"])
+
+        assert result.exit_code == 0, result.output
+        mock_git_manager.assert_called_once_with("/repo")
+        adapter_config = mock_factory.get_adapter.call_args[0][0]
+        assert adapter_config["database"] == "DB_FEATURE_X"
+        adapter.disconnect.assert_called_once_with()
+        assert mock_config.get_active_profile_config.return_value["database"] == "DB"
+
+    @patch("db2repo.cli.GitManager")
+    @patch("db2repo.cli.AdapterFactory")
+    @patch("db2repo.cli.ConfigManager")
+    def test_sync_fetches_missing_types_individually(
+        self, mock_config_manager, mock_factory, mock_git_manager
+    ):
+        """Test that types missing from get_all_objects are fetched one by one."""
+        mock_config = MagicMock()
+        mock_config.profile_exists.return_value = True
+        mock_config.get_profile.return_value = {
+            "platform": "snowflake",
+            "database": "DB",
+            "schema": "PUBLIC",
+            "git_repo_path": "/repo",
+        }
+        mock_config_manager.return_value = mock_config
+        mock_git_manager.return_value.get_current_branch.return_value = "main"
+        adapter = mock_factory.get_adapter.return_value
+        adapter.get_all_objects.side_effect = Exception("unsupported")
+        for method in (
+            "get_tables",
+            "get_views",
+            "get_materialized_views",
+            "get_stages",
+            "get_snowpipes",
+            "get_stored_procedures",
+        ):
+            getattr(adapter, method).return_value = []
+        adapter.get_views.return_value = [
+            DDLRecord("V1", "VIEW", "DB", "PUBLIC", "CREATE VIEW V1")
+        ]
+        adapter.get_stages.side_effect = Exception("boom")
+
+        result = self.runner.invoke(cli, ["sync", "--profile", "dev", "--dry-run"])
+
+        assert result.exit_code == 0, result.output
+        adapter.get_tables.assert_called_once_with("DB", "PUBLIC")
+        adapter.get_stored_procedures.assert_called_once_with("DB", "PUBLIC")
+        assert "Successful: 1" in result.output
+        assert "Error extracting Stages: boom" in result.output
+
+    @patch("db2repo.cli.save_manifest")
+    @patch("db2repo.cli.GitManager")
+    @patch("db2repo.cli.AdapterFactory")
+    @patch("db2repo.cli.ConfigManager")
+    def test_sync_writes_each_file_once(
+        self,
+        mock_config_manager,
+        mock_factory,
+        mock_git_manager,
+        mock_save_manifest,
+        tmp_path,
+    ):
+        """Test that records sharing a file path are written once, last one wins."""
+        mock_config = MagicMock()
+        mock_config.profile_exists.return_value = True
+        mock_config.get_profile.return_value = {
+            "platform": "snowflake",
+            "database": "DB",
+            "schema": "PUBLIC",
+            "git_repo_path": str(tmp_path),
+        }
+        mock_config_manager.return_value = mock_config
+        mock_git_manager.return_value.get_current_branch.return_value = "main"
+        adapter = mock_factory.get_adapter.return_value
+        adapter.get_schema_fingerprint.return_value = None
+        adapter.get_all_objects.return_value = {
+            "PROCEDURE": [
+                DDLRecord("P1", "PROCEDURE", "DB", "PUBLIC", "CREATE PROCEDURE P1()"),
+                DDLRecord("p1", "PROCEDURE", "DB", "PUBLIC", "CREATE PROCEDURE p1(X)"),
+            ],
+        }
+
+        with patch("db2repo.cli.write_file_if_changed", return_value=True) as mock_write:
+            result = self.runner.invoke(cli, ["sync", "--profile", "dev"])
+
+        assert result.exit_code == 0, result.output
+        mock_write.assert_called_once_with(
+            tmp_path / "db" / "public" / "procedure" / "p1.sql",
+            "CREATE PROCEDURE p1(X)",
+        )
+        assert "Successful: 2" in result.output
+        assert len(mock_save_manifest.call_args[0][3]) == 2
+
+    @patch("db2repo.cli.GitManager")
+    @patch("db2repo.cli.AdapterFactory")
+    @patch("db2repo.cli.ConfigManager")
+    def test_sync_skips_unchanged_schema(
+        self, mock_config_manager, mock_factory, mock_git_manager, tmp_path
+    ):
+        """Test that sync stops early when the schema fingerprint is unchanged."""
+        from db2repo.utils.sync_manifest import save_manifest
+
+        manifest_dir = tmp_path / "manifests"
+        save_manifest("dev", "DB", "PUBLIC", [], manifest_dir=str(manifest_dir), fingerprint="1:ts")
+        repo = tmp_path / "repo"
+        (repo / "db" / "public" / "table").mkdir(parents=True)
+        (repo / "db" / "public" / "table" / "t1.sql").write_text("CREATE TABLE T1")
+        mock_config = MagicMock()
+        mock_config.profile_exists.return_value = True
+        mock_config.get_profile.return_value = {
+            "platform": "snowflake",
+            "database": "DB",
+            "schema": "PUBLIC",
+            "git_repo_path": str(repo),
+        }
+        mock_config_manager.return_value = mock_config
+        git_manager = mock_git_manager.return_value
+        git_manager.get_current_branch.return_value = "main"
+        git_manager.has_changes.return_value = False
+        adapter = mock_factory.get_adapter.return_value
+        adapter.get_schema_fingerprint.return_value = "1:ts"
+        adapter.get_all_objects.return_value = {}
+
+        with patch("db2repo.utils.sync_manifest.DEFAULT_MANIFEST_DIR", str(manifest_dir)):
+            result = self.runner.invoke(cli, ["sync", "--profile", "dev"])
+
+            assert result.exit_code == 0, result.output
+            assert "Nothing changed in DB.PUBLIC" in result.output
+            adapter.get_all_objects.assert_not_called()
+
+            result = self.runner.invoke(cli, ["sync", "--profile", "dev", "--force"])
+
+        assert result.exit_code == 0, result.output
+        adapter.get_all_objects.assert_called_once_with("DB", "PUBLIC")
+
+    @patch("db2repo.cli.GitManager")
+    @patch("db2repo.cli.AdapterFactory")
+    @patch("db2repo.cli.ConfigManager")
+    def test_sync_unchanged_schema_still_syncs_dry_run_and_dirty_tree(
+        self, mock_config_manager, mock_factory, mock_git_manager, tmp_path
+    ):
+        """Test that dry runs and empty or edited output trees are never skipped."""
+        from db2repo.utils.sync_manifest import save_manifest
+
+        manifest_dir = tmp_path / "manifests"
+        save_manifest("dev", "DB", "PUBLIC", [], manifest_dir=str(manifest_dir), fingerprint="1:ts")
+        repo = tmp_path / "repo"
+        mock_config = MagicMock()
+        mock_config.profile_exists.return_value = True
+        mock_config.get_profile.return_value = {
+            "platform": "snowflake",
+            "database": "DB",
+            "schema": "PUBLIC",
+            "git_repo_path": str(repo),
+        }
+        mock_config_manager.return_value = mock_config
+        git_manager = mock_git_manager.return_value
+        git_manager.get_current_branch.return_value = "main"
+        git_manager.has_changes.return_value = False
+        adapter = mock_factory.get_adapter.return_value
+        adapter.get_schema_fingerprint.return_value = "1:ts"
+        adapter.get_all_objects.return_value = {}
+
+        with patch("db2repo.utils.sync_manifest.DEFAULT_MANIFEST_DIR", str(manifest_dir)):
+            # The output tree is empty
+            result = self.runner.invoke(cli, ["sync", "--profile", "dev"])
+            assert result.exit_code == 0, result.output
+            assert adapter.get_all_objects.call_count == 1
+
+            (repo / "db").mkdir(parents=True)
+            (repo / "db" / "t1.sql").write_text("CREATE TABLE T1")
+            result = self.runner.invoke(cli, ["sync", "--profile", "dev", "--dry-run"])
+            assert result.exit_code == 0, result.output
+            assert adapter.get_all_objects.call_count == 2
+
+            git_manager.has_changes.return_value = True
+            result = self.runner.invoke(cli, ["sync", "--profile", "dev", "--commit"])
+
+        assert result.exit_code == 0, result.output
+        assert "Nothing changed" not in result.output
+        assert adapter.get_all_objects.call_count == 3
+        git_manager.add_all.assert_called_once_with(str(repo / "db"))
+        git_manager.commit_changes.assert_called_once_with(
+            "Sync DDL from DB.PUBLIC - 0 objects", author_name=None, author_email=None
+        )
+
+    @patch("db2repo.cli.GitManager")
+    @patch("db2repo.cli.AdapterFactory")
+    @patch("db2repo.cli.ConfigManager")
+    def test_sync_cached_dry_run_skips_adapter(
+        self, mock_config_manager, mock_factory, mock_git_manager, tmp_path
+    ):
+        """Test that --dry-run --cached reports the last sync without connecting."""
+        from db2repo.utils.sync_manifest import save_manifest
+
+        save_manifest(
+            "dev",
+            "DB",
+            "PUBLIC",
+            [DDLRecord("T1", "TABLE", "DB", "PUBLIC", "CREATE TABLE T1")],
+            manifest_dir=str(tmp_path),
+        )
+        mock_config = MagicMock()
+        mock_config.profile_exists.return_value = True
+        mock_config.get_profile.return_value = {
+            "platform": "snowflake",
+            "database": "DB",
+            "schema": "PUBLIC",
+            "git_repo_path": "/repo",
+        }
+        mock_config_manager.return_value = mock_config
+        mock_git_manager.return_value.get_current_branch.return_value = "main"
+
+        with patch("db2repo.utils.sync_manifest.DEFAULT_MANIFEST_DIR", str(tmp_path)):
+            result = self.runner.invoke(
+                cli, ["sync", "--profile", "dev", "--dry-run", "--cached"]
+            )
+
+        assert result.exit_code == 0, result.output
+        mock_factory.get_adapter.assert_not_called()
+        assert "TABLE: 1" in result.output
+        assert "Total objects: 1" in result.output
+
+
+class TestBranchCloneCommand:
+    """Test cases for the branch-clone command."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.runner = CliRunner()
+
+    @patch("db2repo.cli.GitManager")
+    @patch("db2repo.cli.AdapterFactory")
+    @patch("db2repo.cli.ConfigManager")
+    def test_branch_clone_skips_connection_probe(
+        self, mock_config_manager, mock_factory, mock_git_manager
+    ):
+        """Test that branch-clone clones without a separate connection test."""
+        mock_config = MagicMock()
+        mock_config.get_profile.return_value = {
+            "platform": "snowflake",
+            "database": "DB",
+            "schema": "PUBLIC",
+            "git_repo_path": "/repo",
+        }
+        mock_config_manager.return_value = mock_config
+        mock_git_manager.return_value.get_current_branch.return_value = "feature-x"
+        adapter = mock_factory.get_adapter.return_value
+        adapter.clone_database.return_value = True
+
+        result = self.runner.invoke(cli, ["branch-clone", "--profile", "dev"])
+
+        assert result.exit_code == 0, result.output
+        adapter.test_connection.assert_not_called()
+        adapter.clone_database.assert_called_once_with("DB", "DB_FEATURE_X")
+        adapter.disconnect.assert_called_once_with()
+
+        result = self.runner.invoke(
+            cli, ["branch-clone", "--profile", "dev", "--check-connection"]
+        )
+
+        assert result.exit_code == 0, result.output
+        adapter.test_connection.assert_called_once_with()
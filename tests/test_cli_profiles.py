@@ -34,7 +34,7 @@ class TestProfileCommands:
     def test_profiles_list_empty(self, mock_config_manager):
         """Test listing profiles when none exist."""
         mock_config = MagicMock()
-        mock_config.list_profiles.return_value = []
+        mock_config.all_profiles.return_value = {}
         mock_config.get_active_profile.return_value = None
         mock_config_manager.return_value = mock_config
     
@@ -44,16 +44,29 @@ class TestProfileCommands:
         assert "No profiles configured" in result.output
         assert "Use 'db2repo setup'" in result.output
 
+    @patch("db2repo.cli.ConfigManager")
+    def test_profiles_use_shared_config_manager(self, mock_config_manager):
+        """Test that commands reuse the ConfigManager on the context object."""
+        mock_config = MagicMock()
+        mock_config.all_profiles.return_value = {}
+
+        result = self.runner.invoke(
+            cli, ["profiles", "list"], obj={"config": mock_config}
+        )
+
+        assert result.exit_code == 0
+        mock_config_manager.assert_not_called()
+        mock_config.all_profiles.assert_called_once()
+
     @patch("db2repo.cli.ConfigManager")
     def test_profiles_list_with_profiles(self, mock_config_manager):
         """Test listing profiles when profiles exist."""
         mock_config = MagicMock()
-        mock_config.list_profiles.return_value = ["dev", "prod"]
-        mock_config.get_active_profile.return_value = "dev"
-        mock_config.get_profile.side_effect = lambda name: {
+        mock_config.all_profiles.return_value = {
             "dev": {"platform": "snowflake", "database": "devdb", "schema": "public"},
             "prod": {"platform": "snowflake", "database": "proddb", "schema": "prod"},
-        }.get(name)
+        }
+        mock_config.get_active_profile.return_value = "dev"
         mock_config_manager.return_value = mock_config
 
         result = self.runner.invoke(cli, ["profiles", "list"])
@@ -173,6 +186,137 @@ class TestSetupCommand:
         mock_config.set_profile.assert_called_once()
         mock_config.set_active_profile.assert_called_once_with("default")
 
+    @patch("db2repo.cli.GitManager")
+    @patch("db2repo.cli.ConfigManager")
+    @patch("click.prompt")
+    @patch("click.confirm")
+    def test_setup_non_interactive(
+        self, mock_confirm, mock_prompt, mock_config_manager, mock_git_manager
+    ):
+        """Test that options and --yes skip every prompt."""
+        mock_config = MagicMock()
+        mock_config.profile_exists.return_value = True
+        mock_config.get_profile_count.return_value = 2
+        mock_config_manager.return_value = mock_config
+        mock_git_manager.is_git_repository.return_value = True
+        mock_git_manager.get_author_identity.return_value = (None, None)
+
+        result = self.runner.invoke(
+            cli,
+            [
+                "setup",
+                "--profile", "ci",
+                "--account", "acct",
+                "--username", "svc",
+                "--auth-method", "ssh_key",
+                "--private-key-path", "/keys/svc.p8",
+                "--private-key-passphrase", "secret",
+                "--max-parallel-ddl", "4",
+                "--warehouse", "",
+                "--database", "DB",
+                "--schema", "PUBLIC",
+                "--role", "",
+                "--git-repo-path", "/repo",
+                "--git-remote-url", "",
+                "--git-branch", "main",
+                "--git-author-name", "CI",
+                "--git-author-email", "ci@example.com",
+                "--yes",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        mock_prompt.assert_not_called()
+        mock_confirm.assert_not_called()
+        profile_config = mock_config.set_profile.call_args[0][1]
+        assert profile_config["private_key_path"] == "/keys/svc.p8"
+        assert profile_config["private_key_passphrase"] == "secret"
+        assert profile_config["max_parallel_ddl"] == 4
+        assert "ddl_cache" not in profile_config
+        assert "warehouse" not in profile_config
+        mock_config.set_active_profile.assert_called_once_with("ci")
+
+    @patch("db2repo.cli.GitManager")
+    @patch("db2repo.cli.ConfigManager")
+    @patch("click.prompt")
+    @patch("click.confirm")
+    def test_setup_reads_snowflake_env_vars(
+        self, mock_confirm, mock_prompt, mock_config_manager, mock_git_manager
+    ):
+        """Test that SNOWFLAKE_* variables stand in for the matching options."""
+        mock_config = MagicMock()
+        mock_config.profile_exists.return_value = False
+        mock_config_manager.return_value = mock_config
+        mock_git_manager.is_git_repository.return_value = True
+        mock_git_manager.get_author_identity.return_value = (None, None)
+
+        result = self.runner.invoke(
+            cli,
+            [
+                "setup",
+                "--profile", "ci",
+                "--auth-method", "external_browser",
+                "--role", "",
+                "--git-repo-path", "/repo",
+                "--git-remote-url", "",
+                "--git-branch", "main",
+                "--git-author-name", "CI",
+                "--git-author-email", "ci@example.com",
+                "--yes",
+            ],
+            env={
+                "SNOWFLAKE_ACCOUNT": "acct",
+                "SNOWFLAKE_USER": "svc",
+                "SNOWFLAKE_WAREHOUSE": "WH",
+                "SNOWFLAKE_DATABASE": "DB",
+                "SNOWFLAKE_SCHEMA": "PUBLIC",
+            },
+        )
+
+        assert result.exit_code == 0, result.output
+        mock_prompt.assert_not_called()
+        profile_config = mock_config.set_profile.call_args[0][1]
+        assert profile_config["account"] == "acct"
+        assert profile_config["username"] == "svc"
+        assert profile_config["warehouse"] == "WH"
+
+    @patch("db2repo.cli.GitManager")
+    @patch("db2repo.cli.ConfigManager")
+    @patch("click.prompt")
+    @patch("click.confirm")
+    def test_setup_from_file(
+        self, mock_confirm, mock_prompt, mock_config_manager, mock_git_manager, tmp_path
+    ):
+        """Test that --from-file supplies profile settings without prompting."""
+        mock_config = MagicMock()
+        mock_config.profile_exists.return_value = False
+        mock_config.get_profile_count.return_value = 1
+        mock_config_manager.return_value = mock_config
+        mock_git_manager.is_git_repository.return_value = True
+        mock_git_manager.get_author_identity.return_value = (None, None)
+        profile_file = tmp_path / "profile.toml"
+        profile_file.write_text(
+            'platform = "snowflake"\n'
+            'account = "acct"\nusername = "svc"\nauth_method = "external_browser"\n'
+            'warehouse = ""\ndatabase = "DB"\nschema = "PUBLIC"\nrole = ""\n'
+            'git_repo_path = "/repo"\ngit_remote_url = ""\ngit_branch = "main"\n'
+            'git_author_name = "CI"\ngit_author_email = "ci@example.com"\n'
+            "ddl_cache = false\nmax_parallel_ddl = 8\n"
+        )
+
+        result = self.runner.invoke(
+            cli,
+            ["setup", "-p", "ci", "--from-file", str(profile_file), "--database", "OTHER"],
+        )
+
+        assert result.exit_code == 0, result.output
+        mock_prompt.assert_not_called()
+        profile_config = mock_config.set_profile.call_args[0][1]
+        assert profile_config["auth_method"] == "external_browser"
+        assert profile_config["database"] == "OTHER"
+        assert profile_config["ddl_cache"] is False
+        assert profile_config["max_parallel_ddl"] == 8
+
     @patch("db2repo.cli.ConfigManager")
     @patch("click.prompt")
     @patch("click.confirm")
@@ -240,6 +384,7 @@ class TestSetupCommand:
         mock_config.get_profile_count.return_value = 0
         mock_config_manager.return_value = mock_config
         mock_git_manager.is_git_repository.return_value = False
+        mock_git_manager.get_author_identity.return_value = (None, None)
         mock_git_manager.initialize_repository.return_value = True
 
         # Mock all the prompts
@@ -281,6 +426,7 @@ class TestSetupCommand:
         mock_config.get_profile_count.return_value = 0
         mock_config_manager.return_value = mock_config
         mock_git_manager.is_git_repository.return_value = False
+        mock_git_manager.get_author_identity.return_value = (None, None)
     
         # Mock all the prompts
         mock_prompt.side_effect = [
@@ -323,6 +469,7 @@ class TestSetupCommand:
         mock_config.get_profile_count.return_value = 0
         mock_config_manager.return_value = mock_config
         mock_git_manager.is_git_repository.return_value = False
+        mock_git_manager.get_author_identity.return_value = (None, None)
     
         # Mock all the prompts
         mock_prompt.side_effect = [
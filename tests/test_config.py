@@ -78,6 +78,18 @@ class TestConfigManager:
             loaded_config = toml.load(f)
         assert loaded_config == test_config
 
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX file modes")
+    def test_save_config_permissions(self):
+        """Test that a new config is private and an existing mode is kept."""
+        self.config_manager._config = {"active_profile": "test"}
+        self.config_manager._save_config()
+        assert self.config_path.stat().st_mode & 0o777 == 0o600
+
+        os.chmod(self.config_path, 0o640)
+        self.config_manager._save_config()
+        assert self.config_path.stat().st_mode & 0o777 == 0o640
+        assert not self.config_path.with_name("test_config.toml.tmp").exists()
+
     def test_get_active_profile(self):
         """Test getting active profile."""
         self.config_manager._config = {"active_profile": "dev"}
@@ -158,6 +170,70 @@ class TestConfigManager:
         profiles = self.config_manager.list_profiles()
         assert profiles == ["dev", "prod"]
 
+    def test_all_profiles(self):
+        """Test getting every profile's configuration in one call."""
+        self.config_manager._config = {
+            "prod": {"platform": "snowflake"},
+            "active_profile": "dev",
+            "dev": {"platform": "snowflake"},
+        }
+        profiles = self.config_manager.all_profiles()
+        assert list(profiles) == ["dev", "prod"]
+        assert profiles["dev"] == {"platform": "snowflake"}
+
+    def test_unchanged_config_parsed_once(self):
+        """Test that an unchanged config file is served from the parse cache."""
+        self.config_manager.set_profile(
+            "dev",
+            {
+                "platform": "snowflake",
+                "account": "a",
+                "username": "u",
+                "auth_method": "external_browser",
+                "database": "D",
+                "schema": "S",
+            },
+        )
+        with patch("db2repo.config.load_toml") as mock_load:
+            first = ConfigManager(str(self.config_path))
+            second = ConfigManager(str(self.config_path))
+        mock_load.assert_not_called()
+        first.get_profile("dev")["database"] = "CHANGED"
+        assert second.get_profile("dev")["database"] == "D"
+
+    def test_batch_saves_once(self):
+        """Test that changes made in a batch are written in one save."""
+        profile = {
+            "platform": "snowflake",
+            "account": "a",
+            "username": "u",
+            "auth_method": "external_browser",
+            "database": "D",
+            "schema": "S",
+        }
+        with patch("db2repo.config.toml.dump", wraps=toml.dump) as mock_dump:
+            with self.config_manager.batch():
+                self.config_manager.set_profile("dev", profile)
+                self.config_manager.set_active_profile("dev")
+                assert not self.config_manager.config_path.exists()
+        mock_dump.assert_called_once()
+        assert toml.load(self.config_path)["active_profile"] == "dev"
+        assert not self.config_path.with_name(self.config_path.name + ".tmp").exists()
+
+    def test_active_profile_key_is_not_a_profile(self):
+        """Test that the active_profile key is never reported as a profile."""
+        self.config_manager._config = {
+            "active_profile": "dev",
+            "dev": {"platform": "snowflake"},
+        }
+        assert self.config_manager.profile_exists("dev")
+        assert not self.config_manager.profile_exists("active_profile")
+        assert self.config_manager.get_profile("active_profile") is None
+        with pytest.raises(ConfigurationError):
+            self.config_manager.delete_profile("active_profile")
+        with pytest.raises(ConfigurationError):
+            self.config_manager.set_profile("active_profile", {"platform": "snowflake"})
+
     def test_list_profiles_empty(self):
         """Test listing profiles when none exist."""
         profiles = self.config_manager.list_profiles()
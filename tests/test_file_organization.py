@@ -4,7 +4,9 @@ import pytest
 from db2repo.utils.file_organization import (
     normalize_name,
     get_ddl_file_path,
+    ddl_file_path_builder,
     write_ddl_file,
+    write_file_if_changed,
     validate_ddl_file_structure,
 )
 
@@ -44,4 +46,19 @@ def test_special_characters_in_names():
         assert "s_c" in str(file_path)
         assert "ta_ble" in str(file_path)
         assert "obj_" in str(file_path)
-        assert file_path.exists() 
\ No newline at end of file
+        assert file_path.exists() 
+
+def test_write_file_if_changed_skips_identical_content():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        file_path = get_ddl_file_path(tmpdir, "DB", "SCHEMA", "Table", "T1")
+        assert write_file_if_changed(file_path, "CREATE TABLE T1;")
+        mtime = file_path.stat().st_mtime_ns
+        assert not write_file_if_changed(file_path, "CREATE TABLE T1;\n")
+        assert file_path.stat().st_mtime_ns == mtime
+        assert write_file_if_changed(file_path, "CREATE TABLE T2;")
+        assert file_path.read_text() == "CREATE TABLE T2;\n"
+
+def test_ddl_file_path_builder_matches_get_ddl_file_path():
+    build = ddl_file_path_builder("/repo", "My DB", "Public", ".sql")
+    for object_type, name in [("TABLE", "Orders"), ("MATERIALIZED_VIEW", "a-b"), ("TABLE", "x y")]:
+        assert build(object_type, name) == get_ddl_file_path("/repo", "My DB", "Public", object_type, name)
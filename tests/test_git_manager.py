@@ -41,6 +41,39 @@ def test_get_status_and_add_commit():
         assert not status["untracked"]
 
 
+def test_add_all_stages_only_the_given_path():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo_path = Path(tmpdir)
+        GitManager.initialize_repository(repo_path)
+        gm = GitManager(str(repo_path))
+        ddl_dir = repo_path / "db" / "public" / "table"
+        ddl_dir.mkdir(parents=True)
+        (ddl_dir / "t1.sql").write_text("CREATE TABLE T1;")
+        (ddl_dir / "t2.sql").write_text("CREATE TABLE T2;")
+        (repo_path / "notes.txt").write_text("unrelated")
+        assert gm.add_all(str(repo_path / "db"))
+        staged = {path for path, _ in gm.repo.index.entries}
+        assert staged == {"db/public/table/t1.sql", "db/public/table/t2.sql"}
+
+
+def test_has_changes_checks_only_the_given_path():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo_path = Path(tmpdir)
+        GitManager.initialize_repository(repo_path)
+        gm = GitManager(str(repo_path))
+        (repo_path / "db").mkdir()
+        (repo_path / "db" / "t1.sql").write_text("CREATE TABLE T1;\n")
+        (repo_path / "notes.txt").write_text("scratch")
+        assert gm.has_changes(str(repo_path / "db"))
+        assert gm.add_all(str(repo_path / "db"))
+        assert gm.has_changes(str(repo_path / "db"))
+        assert gm.commit_changes(
+            "Sync", author_name="Test", author_email="test@example.com"
+        )
+        assert not gm.has_changes(str(repo_path / "db"))
+        assert gm.has_changes()
+
+
 def test_invalid_repo_raises():
     with tempfile.TemporaryDirectory() as tmpdir:
         repo_path = Path(tmpdir) / "not_a_repo"
@@ -61,3 +94,47 @@ def test_add_files_error():
         # Try to add a non-existent file
         with pytest.raises(GitCommandError):
             gm.add_files([str(repo_path / "does_not_exist.txt")])
+
+
+def test_get_author_identity_reads_repo_config():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo_path = Path(tmpdir)
+        GitManager.initialize_repository(repo_path)
+        with Repo(str(repo_path)).config_writer() as writer:
+            writer.set_value("user", "name", "Jane Doe")
+            writer.set_value("user", "email", "jane@example.com")
+        assert GitManager.get_author_identity(str(repo_path)) == ("Jane Doe", "jane@example.com")
+        subdir = repo_path / "db" / "schema"
+        subdir.mkdir(parents=True)
+        assert GitManager.get_author_identity(str(subdir)) == ("Jane Doe", "jane@example.com")
+
+
+def test_get_branches_lists_local_heads():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo_path = Path(tmpdir)
+        GitManager.initialize_repository(repo_path)
+        gm = GitManager(str(repo_path))
+        (repo_path / "a.sql").write_text("x")
+        gm.add_files([str(repo_path / "a.sql")])
+        gm.commit_changes("init")
+        gm.create_branch("feature-x")
+        assert sorted(gm.get_branches()) == sorted([gm.get_current_branch(), "feature-x"])
+
+
+def test_get_status_parses_renames_and_spaces():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo_path = Path(tmpdir)
+        GitManager.initialize_repository(repo_path)
+        gm = GitManager(str(repo_path))
+        (repo_path / "a b.sql").write_text("1")
+        (repo_path / "c.sql").write_text("1")
+        gm.add_files([str(repo_path / "a b.sql"), str(repo_path / "c.sql")])
+        gm.commit_changes("init", author_name="Test", author_email="test@example.com")
+        (repo_path / "a b.sql").write_text("2")
+        gm.repo.git.mv("c.sql", "d.sql")
+        (repo_path / "new.sql").write_text("1")
+        status = gm.get_status()
+        assert status["changed"] == ["a b.sql"]
+        assert status["untracked"] == ["new.sql"]
+        assert status["branch"] == gm.get_current_branch()
+        assert status["is_dirty"]